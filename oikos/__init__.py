@@ -52,6 +52,7 @@ from .utilidades import (
     CIAN,
     COLOR_DEMANDA,
     COLOR_OFERTA,
+    Colores,
     CORAL,
     DERECHA,
     EstiloGrafico,
@@ -76,6 +77,7 @@ from .utilidades import (
     explicacion,
     extraerVariables,
     graficoRapido,
+    refrescarEntorno,
     translatex,
     validarNoNegativo,
     validarPositivo,
@@ -122,7 +124,9 @@ __all__ = [
     "EstiloGrafico",
     "graficoRapido",
     "Lienzo",
+    "refrescarEntorno",
     # Colores
+    "Colores",
     "AMARILLO",
     "AMARILLO2",
     "AZUL",
@@ -7,7 +7,9 @@ Este módulo contiene las clases fundamentales para análisis de mercados:
 - equilibrio(): Calcula el punto donde se cruzan oferta y demanda
 """
 
-from sympy import symbols, solve, diff, lambdify, integrate
+import numpy as np
+from sympy import symbols, solve, diff, lambdify, integrate, Poly
+from sympy.polys.polyerrors import PolynomialError
 from typing import Dict, Optional, Tuple
 from ..nucleo.base import MercadoBase
 from ..nucleo.excepciones import ErrorEquilibrio, ErrorValidacion
@@ -16,6 +18,56 @@ from ..utilidades.decoradores import ayuda, explicacion
 from ..utilidades.validadores import validarPositivo, validarNoNegativo
 
 
+def _coeficientesPrecio(funcion) -> Optional[Tuple[float, ...]]:
+    """
+    Coeficientes del precio como polinomio en Q (del mayor grado al menor).
+
+    El resultado se guarda en el objeto y solo se recalcula si cambia la
+    expresión.
+
+    Returns:
+        Tupla de coeficientes, o None si P(Q) no es un polinomio con
+        coeficientes numéricos
+    """
+    clave = hash(funcion.expresion)
+    guardados = getattr(funcion, '_coeficientesGuardados', None)
+    if guardados is not None and guardados[0] == clave:
+        return guardados[1]
+
+    coeficientes = None
+    try:
+        solucion = solve(funcion.expresion, funcion.P)
+        # Con varias soluciones precio() usa la primera: mejor no adivinar
+        if len(solucion) == 1:
+            coeficientes = tuple(float(c) for c in Poly(solucion[0], funcion.Q).all_coeffs())
+    except (PolynomialError, NotImplementedError, TypeError):
+        pass
+
+    funcion._coeficientesGuardados = (clave, coeficientes)
+    return coeficientes
+
+
+def _evaluarPrecioPolinomico(funcion, cantidades: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Evalúa precio() sobre todo un arreglo de cantidades con np.polyval.
+
+    Lienzo lo usa para graficar la curva de una vez en lugar de llamar a
+    precio() punto por punto. Respeta el mismo dominio: el precio nunca es
+    negativo y las cantidades negativas (que precio() rechaza) dan NaN.
+
+    Returns:
+        Arreglo de precios, o None si P(Q) no es polinómica (ver _coeficientesPrecio)
+    """
+    coeficientes = _coeficientesPrecio(funcion)
+    if coeficientes is None:
+        return None
+
+    cantidades = np.asarray(cantidades, dtype=float)
+    precios = np.maximum(np.polyval(coeficientes, cantidades), 0)
+    precios[cantidades < 0] = np.nan
+    return precios
+
+
 @ayuda(
     descripcionEconomica="""
     La Demanda representa la relación entre el precio de un bien y la cantidad
@@ -279,6 +331,10 @@ class Demanda:
         lienzo.graficar()
         return lienzo
 
+    def _precioVectorizado(self, cantidades) -> Optional[np.ndarray]:
+        """precio() sobre un arreglo de cantidades (ver _evaluarPrecioPolinomico)."""
+        return _evaluarPrecioPolinomico(self, cantidades)
+
     def __repr__(self):
         return f"Demanda('{self.ecuacionOriginal}')"
 
@@ -549,6 +605,10 @@ class Oferta:
         lienzo.graficar()
         return lienzo
 
+    def _precioVectorizado(self, cantidades) -> Optional[np.ndarray]:
+        """precio() sobre un arreglo de cantidades (ver _evaluarPrecioPolinomico)."""
+        return _evaluarPrecioPolinomico(self, cantidades)
+
     def __repr__(self):
         return f"Oferta('{self.ecuacionOriginal}')"
 
@@ -34,6 +34,7 @@ from .visuales import (
     CIAN,
     COLOR_DEMANDA,
     COLOR_OFERTA,
+    Colores,
     CORAL,
     DERECHA,
     EstiloGrafico,
@@ -54,6 +55,7 @@ from .visuales import (
     VIOLETA,
     escribir,
     graficoRapido,
+    refrescarEntorno,
 )
 
 __all__ = [
@@ -73,7 +75,9 @@ __all__ = [
     "EstiloGrafico",
     "graficoRapido",
     "Lienzo",
+    "refrescarEntorno",
     # Colores
+    "Colores",
     "AMARILLO",
     "AMARILLO2",
     "AZUL",
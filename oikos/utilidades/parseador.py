@@ -5,6 +5,7 @@ Convierte expresiones matemáticas escritas en LaTeX a objetos SymPy
 que pueden ser manipulados simbólicamente.
 """
 
+from functools import lru_cache
 from latex2sympy2 import latex2sympy
 from sympy import symbols, solve, Eq
 from typing import Optional, Union, Tuple
@@ -47,49 +48,73 @@ def translatex(expresionLatex: str, variableDespejar: Optional[str] = None):
         >>> # Despeja P en función de Q
     """
     try:
-        # Limpiamos espacios y verificamos si hay igualdad
-        expresionLatex = expresionLatex.strip()
-        tieneIgualdad = "=" in expresionLatex
-        
-        if tieneIgualdad:
-            # Separamos los lados de la ecuación
-            ladoIzquierdo, ladoDerecho = expresionLatex.split("=", 1)
-            
-            # Convertimos cada lado a SymPy
-            izq = latex2sympy(ladoIzquierdo.strip())
-            der = latex2sympy(ladoDerecho.strip())
-            
-            # Si el usuario especificó variable, despejamos
-            if variableDespejar:
-                variable = symbols(variableDespejar)
-                ecuacion = Eq(izq, der)
-                solucion = solve(ecuacion, variable)
-                
-                if not solucion:
-                    raise ErrorParseador(
-                        expresionLatex,
-                        f"No se pudo despejar {variableDespejar}"
-                    )
-                
-                # Retornamos la primera solución
-                return solucion[0] if len(solucion) == 1 else solucion
-            
-            # IMPORTANTE: NO despejamos automáticamente
-            # Las clases Demanda/Oferta necesitan la ecuación completa para poder
-            # despejar P o Q según lo necesiten
-            # Retornamos siempre la ecuación completa como Eq(izq, der)
-            return Eq(izq, der)
-        
-        else:
-            # No hay igualdad, solo parseamos la expresión
-            return latex2sympy(expresionLatex)
-    
+        resultado = _translatexCacheado(_normalizarLatex(expresionLatex), variableDespejar)
     except Exception as e:
         raise ErrorParseador(
-            expresionLatex,
+            expresionLatex.strip() if isinstance(expresionLatex, str) else expresionLatex,
             f"Error al parsear: {str(e)}"
         )
 
+    # Las expresiones de SymPy son inmutables y se pueden compartir, pero una
+    # lista de soluciones sí se puede modificar: devolvemos una copia
+    return list(resultado) if isinstance(resultado, list) else resultado
+
+
+def _normalizarLatex(expresionLatex: str) -> str:
+    """
+    Limpia los espacios externos y los que rodean al '=' para que
+    "Q=100-2P" y "Q = 100-2P" compartan la misma entrada de la caché.
+    """
+    expresionLatex = expresionLatex.strip()
+    if "=" in expresionLatex:
+        ladoIzquierdo, ladoDerecho = expresionLatex.split("=", 1)
+        return f"{ladoIzquierdo.strip()}={ladoDerecho.strip()}"
+    return expresionLatex
+
+
+@lru_cache(maxsize=256)
+def _translatexCacheado(expresionLatex: str, variableDespejar: Optional[str]):
+    """
+    Parseo real de translatex().
+
+    latex2sympy es un parser ANTLR (decenas de ms por llamada), así que
+    memorizamos el resultado: en un notebook la misma ecuación se vuelve a
+    parsear cada vez que se re-ejecuta una celda.
+    """
+    tieneIgualdad = "=" in expresionLatex
+
+    if tieneIgualdad:
+        # Separamos los lados de la ecuación (ya vienen sin espacios externos)
+        ladoIzquierdo, ladoDerecho = expresionLatex.split("=", 1)
+
+        # Convertimos cada lado a SymPy
+        izq = latex2sympy(ladoIzquierdo)
+        der = latex2sympy(ladoDerecho)
+
+        # Si el usuario especificó variable, despejamos
+        if variableDespejar:
+            variable = symbols(variableDespejar)
+            ecuacion = Eq(izq, der)
+            solucion = solve(ecuacion, variable)
+
+            if not solucion:
+                raise ErrorParseador(
+                    expresionLatex,
+                    f"No se pudo despejar {variableDespejar}"
+                )
+
+            # Retornamos la primera solución
+            return solucion[0] if len(solucion) == 1 else solucion
+
+        # IMPORTANTE: NO despejamos automáticamente
+        # Las clases Demanda/Oferta necesitan la ecuación completa para poder
+        # despejar P o Q según lo necesiten
+        # Retornamos siempre la ecuación completa como Eq(izq, der)
+        return Eq(izq, der)
+
+    # No hay igualdad, solo parseamos la expresión
+    return latex2sympy(expresionLatex)
+
 
 def despejar(ecuacion, variable: str):
     """
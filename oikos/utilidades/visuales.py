@@ -7,49 +7,104 @@ Este módulo contiene:
 - EstiloGrafico: Configuración de estilos visuales
 """
 
-from IPython.display import display, Math
-from sympy import latex
-import matplotlib.pyplot as plt
+import sys
 import numpy as np
-from typing import Optional, Tuple, List, Union, Callable
-from dataclasses import dataclass, field
+from typing import Optional, Tuple, Callable
+from dataclasses import dataclass, fields
+from enum import Enum
+from functools import lru_cache, partial
+from ..nucleo.excepciones import ErrorGrafico, ErrorOikos
+
+# matplotlib, IPython y el impresor LaTeX de SymPy se importan dentro de las
+# funciones que los usan: quien solo necesita escribir() en una terminal o los
+# colores no paga el costo de cargar matplotlib.pyplot al importar oikos.
 
 
 # ============= COLORES PREDEFINIDOS =============
 # Usa estos colores con el prefijo 'ok.' para consistencia con 'import oikos as ok'
 # Ejemplo: lienzo.agregar(demanda, color=ok.ROJO)
 
-# COLORES PUROS
-ROJO     = "#FF0000"
-AZUL     = "#0000FF"
-VERDE    = "#00FF00"
-AMARILLO = "#FFFF00"
-CIAN     = "#00FFFF"
-MAGENTA  = "#FF00FF"
-
-NARANJA  = "#FF7F00"
-MORADO   = "#8000FF"
-ROSA     = "#FF1493"
-LIMA     = "#32FF00"
-
-# COLORES SUAVES
-TURQUESA = "#00BFFF"
-CELESTE  = "#1E90FF"
-VIOLETA  = "#9400D3"
-CORAL    = "#FF4040"
-
-ROJO2    = "#FF3333"
-AZUL2    = "#0066FF"
-VERDE2   = "#00CC66"
-AMARILLO2= "#FFD700"
-
-GRIS     = "#666666"
-NEGRO    = "#000000"
+class Colores(str, Enum):
+    """
+    Colores predefinidos de Oikos.
+
+    Cada miembro es también un str (su código hexadecimal), así que puede
+    usarse en cualquier lugar donde matplotlib espere un color.
+
+    Ejemplo:
+        >>> import oikos as ok
+        >>> ok.Colores("#FF0000")   # Búsqueda por valor: <Colores.ROJO: '#FF0000'>
+        >>> ok.Colores["AZUL"]      # Búsqueda por nombre
+        >>> ok.ROJO == "#FF0000"    # True
+    """
+
+    # COLORES PUROS
+    ROJO     = "#FF0000"
+    AZUL     = "#0000FF"
+    VERDE    = "#00FF00"
+    AMARILLO = "#FFFF00"
+    CIAN     = "#00FFFF"
+    MAGENTA  = "#FF00FF"
+
+    NARANJA  = "#FF7F00"
+    MORADO   = "#8000FF"
+    ROSA     = "#FF1493"
+    LIMA     = "#32FF00"
+
+    # COLORES SUAVES
+    TURQUESA = "#00BFFF"
+    CELESTE  = "#1E90FF"
+    VIOLETA  = "#9400D3"
+    CORAL    = "#FF4040"
+
+    ROJO2    = "#FF3333"
+    AZUL2    = "#0066FF"
+    VERDE2   = "#00CC66"
+    AMARILLO2= "#FFD700"
+
+    GRIS     = "#666666"
+    NEGRO    = "#000000"
+
+    # Se comportan exactamente como el string hexadecimal (igual que enum.StrEnum,
+    # que no usamos porque requiere Python 3.11)
+    __str__ = str.__str__
+    __format__ = str.__format__
+    __hash__ = str.__hash__
+
+
+# Alias a nivel de módulo (compatibilidad con ok.ROJO, ok.AZUL, ...)
+ROJO      = Colores.ROJO
+AZUL      = Colores.AZUL
+VERDE     = Colores.VERDE
+AMARILLO  = Colores.AMARILLO
+CIAN      = Colores.CIAN
+MAGENTA   = Colores.MAGENTA
+
+NARANJA   = Colores.NARANJA
+MORADO    = Colores.MORADO
+ROSA      = Colores.ROSA
+LIMA      = Colores.LIMA
+
+TURQUESA  = Colores.TURQUESA
+CELESTE   = Colores.CELESTE
+VIOLETA   = Colores.VIOLETA
+CORAL     = Colores.CORAL
+
+ROJO2     = Colores.ROJO2
+AZUL2     = Colores.AZUL2
+VERDE2    = Colores.VERDE2
+AMARILLO2 = Colores.AMARILLO2
+
+GRIS      = Colores.GRIS
+NEGRO     = Colores.NEGRO
 
 # COLORES POR DEFECTO PARA ECONOMÍA
 COLOR_DEMANDA = ROJO   # Rojo para demanda
 COLOR_OFERTA = AZUL    # Azul para oferta
 
+# Paleta por defecto de EstiloGrafico (tupla inmutable compartida por todos los estilos)
+_PALETA_DEFECTO: Tuple[str, ...] = tuple(Colores)
+
 # ============= CONSTANTES DE DIRECCIÓN =============
 # Para alinear ejes entre cuadrantes en gráficos matriciales
 # Ejemplo: lienzo.cuadrante(2, 1, alinearX=ok.ARRIBA)
@@ -59,6 +114,145 @@ IZQUIERDA = 'IZQUIERDA'
 DERECHA = 'DERECHA'
 
 
+def _detectarJupyter() -> bool:
+    """Indica si hay un kernel de IPython/Jupyter activo."""
+    # Si IPython no está cargado no puede haber un kernel activo, así que
+    # evitamos importarlo (su importación es costosa) en scripts y terminales
+    ipython = sys.modules.get('IPython')
+    if ipython is None:
+        return False
+    return ipython.get_ipython() is not None
+
+
+# Detectamos el entorno una sola vez al importar el módulo
+_EN_JUPYTER: bool = _detectarJupyter()
+
+
+def refrescarEntorno() -> bool:
+    """
+    Vuelve a detectar si estamos en Jupyter/Colab o en una terminal.
+
+    escribir() detecta el entorno una sola vez al importar oikos. Usa esta
+    función si IPython se inició después de importar la librería.
+
+    Returns:
+        True si se detectó un entorno Jupyter, False en caso contrario
+    """
+    global _EN_JUPYTER
+    _EN_JUPYTER = _detectarJupyter()
+    return _EN_JUPYTER
+
+
+@lru_cache(maxsize=1024)
+def _latexCacheado(expresion) -> str:
+    """Convierte una expresión de SymPy a LaTeX, reutilizando conversiones previas."""
+    from sympy import latex
+    return latex(expresion)
+
+
+def _aLatex(valor) -> str:
+    """Convierte un valor a LaTeX, cacheando solo las expresiones de SymPy."""
+    # Los valores primitivos no necesitan pasar por SymPy
+    if isinstance(valor, (int, float, str)):
+        return str(valor)
+
+    from sympy import Basic, latex
+    if isinstance(valor, Basic):
+        return _latexCacheado(valor)
+    return latex(valor)
+
+
+@lru_cache(maxsize=1)
+def _espacioMath():
+    """Objeto Math del espacio tras el título, creado una sola vez (y solo en Jupyter)."""
+    from IPython.display import Math
+    return Math(r"\text{ }")
+
+
+def _mostrarTituloJupyter(titulo: Optional[str]):
+    """Muestra el título (y un espacio) antes del contenido en Jupyter."""
+    from IPython.display import display, Math
+
+    if titulo:
+        display(Math(rf"\textbf{{{titulo}}}"))
+        display(_espacioMath())  # Espacio
+
+
+def _renderizarDictJupyter(contenido: dict, titulo: Optional[str]):
+    """Muestra un diccionario de resultados en Jupyter."""
+    from IPython.display import display, Math
+
+    # Todas las variables (y el título) van en un solo bloque 'aligned',
+    # así MathJax tipografía una sola vez en lugar de una vez por línea
+    lineas = r" \\ ".join(
+        rf"{variable} &= {_aLatex(valor)}" for variable, valor in contenido.items()
+    )
+    bloque = rf"\begin{{aligned}} {lineas} \end{{aligned}}"
+
+    if titulo:
+        bloque = rf"\begin{{array}}{{l}} \textbf{{{titulo}}} \\[0.5em] {bloque} \end{{array}}"
+
+    display(Math(bloque))
+
+
+def _renderizarStrJupyter(contenido: str, titulo: Optional[str]):
+    """Muestra un string directamente en formato LaTeX en Jupyter."""
+    from IPython.display import display, Math
+
+    _mostrarTituloJupyter(titulo)
+    display(Math(contenido))
+
+
+def _renderizarOtroJupyter(contenido, titulo: Optional[str]):
+    """Fallback: muestra cualquier otro valor convertido a string."""
+    from IPython.display import display, Math
+
+    _mostrarTituloJupyter(titulo)
+    display(Math(str(contenido)))
+
+
+# Renderizadores de escribir() en Jupyter según el tipo del contenido
+_RENDERIZADORES_JUPYTER = {
+    dict: _renderizarDictJupyter,
+    str: _renderizarStrJupyter,
+}
+
+
+def _renderizadorJupyter(contenido) -> Callable:
+    """Elige el renderizador por tipo, considerando subclases (ej. OrderedDict)."""
+    for tipo in type(contenido).__mro__:
+        renderizador = _RENDERIZADORES_JUPYTER.get(tipo)
+        if renderizador is not None:
+            return renderizador
+    return _renderizarOtroJupyter
+
+
+# Separador de títulos en la salida de terminal
+_SEPARADOR = "=" * 50
+
+
+def _escribirTerminal(contenido, titulo: Optional[str]):
+    """Muestra el contenido de escribir() como texto plano en la terminal."""
+    # Se arma toda la salida y se escribe con un solo print
+    partes = []
+    if titulo:
+        partes.append(f"\n{_SEPARADOR}\n  {titulo}\n{_SEPARADOR}")
+
+    # Si es un diccionario, cada resultado va en su propia línea
+    if isinstance(contenido, dict):
+        partes.extend(f"  {variable} = {valor}" for variable, valor in contenido.items())
+
+    # Si es un string u otro tipo
+    else:
+        partes.append(f"  {contenido}")
+
+    if titulo:
+        partes.append(f"{_SEPARADOR}\n")
+
+    if partes:
+        print("\n".join(partes))
+
+
 def escribir(contenido, titulo: Optional[str] = None):
     """
     Muestra resultados económicos en formato LaTeX (Jupyter) o texto plano (terminal).
@@ -81,64 +275,17 @@ def escribir(contenido, titulo: Optional[str] = None):
         >>> resultados = {'Q^*': 50, 'P^*': 10, 'E_p': -1.5}
         >>> escribir(resultados, "Equilibrio de Mercado")
     """
-    # Verificamos si estamos en Jupyter/Colab o terminal
-    try:
-        from IPython import get_ipython
-        enJupyter = get_ipython() is not None
-    except ImportError:
-        enJupyter = False
-
-    if enJupyter:
-        # ====== JUPYTER/COLAB ======
-        # Mostramos el título si existe
-        if titulo:
-            display(Math(rf"\textbf{{{titulo}}}"))
-            display(Math(r"\text{ }"))  # Espacio
-
-        # Si es un diccionario
-        if isinstance(contenido, dict):
-            # Mostramos cada variable en su propia línea
-            for variable, valor in contenido.items():
-                # Convertimos el valor a LaTeX si es necesario
-                valorLatex = latex(valor) if hasattr(valor, '__class__') and not isinstance(valor, (int, float, str)) else str(valor)
-
-                # Mostramos cada resultado en su propia línea
-                ecuacion = rf"{variable} = {valorLatex}"
-                display(Math(ecuacion))
-
-        # Si es un string
-        elif isinstance(contenido, str):
-            # Mostramos el string directamente en formato LaTeX
-            display(Math(contenido))
-
-        else:
-            # Fallback: convertir a string
-            display(Math(str(contenido)))
-
-    else:
-        # ====== TERMINAL ======
-        if titulo:
-            print(f"\n{'='*50}")
-            print(f"  {titulo}")
-            print(f"{'='*50}")
-
-        # Si es un diccionario
-        if isinstance(contenido, dict):
-            # Mostramos cada resultado en su propia línea
-            for variable, valor in contenido.items():
-                print(f"  {variable} = {valor}")
+    # El entorno (Jupyter/Colab o terminal) se detecta una sola vez al importar.
+    # En terminal salimos antes de tocar SymPy o IPython.
+    if not _EN_JUPYTER:
+        _escribirTerminal(contenido, titulo)
+        return
 
-            if titulo:
-                print(f"{'='*50}\n")
-
-        # Si es un string u otro tipo
-        else:
-            print(f"  {contenido}")
-            if titulo:
-                print(f"{'='*50}\n")
+    # ====== JUPYTER/COLAB ======
+    _renderizadorJupyter(contenido)(contenido, titulo)
 
 
-@dataclass
+@dataclass(frozen=True)
 class EstiloGrafico:
     """
     Configuración de estilo para gráficos económicos.
@@ -147,11 +294,13 @@ class EstiloGrafico:
     colores, fuentes, dimensiones, etc.
 
     Atributos:
-        paletaColores: Lista de colores para usar en las curvas
+        paletaColores: Secuencia de colores para usar en las curvas
         anchoLinea: Grosor de las curvas económicas
         anchoEje: Grosor de los ejes
         dimensionFigura: (ancho, alto) de la figura en pulgadas
         familiaFuente: Familia de fuente ('serif', 'sans-serif', 'monospace')
+        simplificarTrazos: Si True, matplotlib simplifica las curvas al dibujarlas
+        umbralSimplificacion: Desviación máxima (en píxeles) tolerada al simplificar
 
     Ejemplo:
         >>> import oikos as ok
@@ -161,37 +310,15 @@ class EstiloGrafico:
         ...     anchoLinea=3.0
         ... )
         >>> lienzo = ok.Lienzo(estilo=mi_estilo)
+
+    El estilo es inmutable (todos los Lienzos sin estilo propio comparten el
+    mismo). Para crear una variante usa dataclasses.replace:
+        >>> from dataclasses import replace
+        >>> estilo_grueso = replace(mi_estilo, anchoLinea=4.0)
     """
 
     # Paleta de colores VIVOS (nueva para v0.3.1)
-    paletaColores: List[str] = field(default_factory=lambda: [
-        # COLORES PUROS
-        "#FF0000",  # ROJO
-        "#0000FF",  # AZUL
-        "#00FF00",  # VERDE
-        "#FFFF00",  # AMARILLO
-        "#00FFFF",  # CIAN
-        "#FF00FF",  # MAGENTA
-
-        "#FF7F00",  # NARANJA
-        "#8000FF",  # MORADO
-        "#FF1493",  # ROSA
-        "#32FF00",  # LIMA
-
-        # COLORES SUAVES
-        "#00BFFF",  # TURQUESA
-        "#1E90FF",  # CELESTE
-        "#9400D3",  # VIOLETA
-        "#FF4040",  # CORAL
-
-        "#FF3333",  # ROJO2
-        "#0066FF",  # AZUL2
-        "#00CC66",  # VERDE2
-        "#FFD700",  # AMARILLO2
-
-        "#666666",  # GRIS
-        "#000000"   # NEGRO
-    ])
+    paletaColores: Tuple[str, ...] = _PALETA_DEFECTO
 
     # Estilo de líneas
     anchoLinea: float = 2.5
@@ -223,6 +350,335 @@ class EstiloGrafico:
     # Áreas de relleno
     alphaRelleno: float = 0.3
 
+    # Simplificación de trazos (las curvas económicas son suaves y la toleran bien)
+    simplificarTrazos: bool = True
+    umbralSimplificacion: float = 1.0
+
+    def __post_init__(self):
+        # Guardamos la paleta y cualquier otra secuencia (ej. dimensionFigura=[8, 6])
+        # como tupla para que el estilo sea realmente inmutable y hashable
+        object.__setattr__(self, 'paletaColores', tuple(self.paletaColores))
+        for campo in fields(self):
+            valor = getattr(self, campo.name)
+            if isinstance(valor, (list, np.ndarray)):
+                object.__setattr__(self, campo.name, tuple(valor))
+
+
+# Estilo compartido por todos los Lienzos creados sin estilo propio
+_ESTILO_DEFECTO = EstiloGrafico()
+
+
+@lru_cache(maxsize=16)
+def _configuracionEjes(estilo: EstiloGrafico) -> Tuple[dict, dict, dict, dict]:
+    """
+    Argumentos de matplotlib para el grid, los bordes y las fuentes de un estilo.
+
+    El estilo es inmutable, así que se resuelven una sola vez y los Lienzos
+    que comparten estilo comparten también esta configuración. Los
+    diccionarios solo se usan desempaquetados (**), nunca se modifican.
+
+    Returns:
+        (grid, bordes, fuenteLabel, fuenteTitulo)
+    """
+    grid = dict(
+        alpha=estilo.alphaGrid,
+        linestyle=estilo.estiloLineaGrid,
+        linewidth=estilo.anchoGrid,
+        color=estilo.colorGrid
+    )
+    bordes = dict(visible=True, linewidth=estilo.anchoEje, color=estilo.colorEje)
+    fuenteLabel = dict(fontsize=estilo.dimensionLabel, fontweight=estilo.pesoFuenteLabel)
+    fuenteTitulo = dict(fontsize=estilo.dimensionTitulo, fontweight=estilo.pesoFuenteTitulo)
+    return grid, bordes, fuenteLabel, fuenteTitulo
+
+
+# ============= EVALUACIÓN VECTORIZADA =============
+
+# Límites del número de puntos evaluados por curva o relleno. El máximo
+# corresponde a _DPI_REFERENCIA y crece en proporción con la resolución
+# (ej. al guardar con dpi=300)
+_MUESTRAS_MIN = 50
+_MUESTRAS_MAX = 500
+_DPI_REFERENCIA = 100
+
+# Mallas de x distintas que un Lienzo guarda como máximo
+_MAX_MALLAS = 32
+
+# Errores esperables al evaluar punto a punto (fuera del dominio, división
+# por cero, validaciones de oikos): ese punto se deja como NaN. Cualquier otro
+# error es un fallo real de la función y se propaga.
+_ERRORES_EVALUACION = (ArithmeticError, ValueError, TypeError, ErrorOikos)
+
+def _evaluarEnArreglo(funcion: Callable, valoresX: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Intenta evaluar la función sobre todo el arreglo de una sola vez.
+
+    La mayoría de funciones de oikos (y las lambdas con operaciones
+    aritméticas) aceptan arreglos de numpy directamente, lo que evita
+    un bucle de Python punto por punto.
+
+    Returns:
+        Arreglo de floats con la misma forma que valoresX (las funciones
+        constantes se extienden a todo el arreglo), o None si la función no
+        acepta arreglos (en ese caso se debe evaluar punto a punto).
+    """
+    try:
+        valoresY = np.asarray(funcion(valoresX))
+        if np.iscomplexobj(valoresY):
+            valoresY = valoresY.real
+        valoresY = valoresY.astype(float, copy=False)
+    except Exception:
+        return None
+
+    # Una función constante (ej. lambda x: 10) devuelve un escalar: si en los
+    # extremos de la malla da ese mismo valor, se extiende a todo el arreglo
+    if valoresY.ndim == 0 and valoresX.size:
+        valor = float(valoresY)
+        try:
+            extremos = (funcion(valoresX[0]), funcion(valoresX[-1]))
+        except Exception:
+            return None
+        if all(np.real(y) == valor for y in extremos):
+            return np.full(valoresX.shape, valor)
+        return None
+
+    # Una función que reduce su argumento (ej. sum) no sirve vectorizada
+    if valoresY.shape != valoresX.shape:
+        return None
+    return valoresY
+
+
+def _evaluarPuntoAPunto(funcion: Callable, valoresX: np.ndarray) -> np.ndarray:
+    """
+    Evalúa la función sobre todo el arreglo si lo acepta y, si no, punto a
+    punto dejando NaN donde la función no está definida.
+    """
+    valoresY = _evaluarEnArreglo(funcion, valoresX)
+    if valoresY is not None:
+        return valoresY
+
+    valoresY = []
+    for x in valoresX:
+        try:
+            y = funcion(x)
+            # Asegurar que sea real
+            if isinstance(y, complex):
+                y = y.real
+            valoresY.append(y)
+        except _ERRORES_EVALUACION:
+            valoresY.append(np.nan)
+    return np.array(valoresY)
+
+
+def _funcionPolinomica(expresion, variable) -> Optional[Callable]:
+    """
+    Si la expresión es un polinomio de grado <= 3 con coeficientes numéricos
+    (el caso típico: demandas y ofertas lineales o cuadráticas), devuelve una
+    función que lo evalúa con np.polyval (Horner) sin pasar por lambdify.
+
+    Returns:
+        Función f(valoresX) o None si la expresión no es un polinomio así.
+    """
+    from sympy import Expr, Poly, PolynomialError
+
+    # Ecuaciones (Eq) y otras relaciones no son expresiones evaluables
+    if not isinstance(expresion, Expr):
+        return None
+
+    try:
+        polinomio = Poly(expresion, variable)
+        if polinomio.degree() > 3:
+            return None
+        coeficientes = np.array([float(c) for c in polinomio.all_coeffs()])
+    except (PolynomialError, TypeError, ValueError):
+        return None
+
+    return partial(np.polyval, coeficientes)
+
+
+# ============= REGISTROS INTERNOS DEL LIENZO =============
+# Cada elemento agregado al Lienzo se guarda en uno de estos registros.
+# Usan __slots__ para ocupar poca memoria y acceder rápido a sus campos.
+# kwargsPlot (slot fuera de los campos del dataclass, se llena en __post_init__)
+# guarda ya armados los argumentos de estilo que se pasan a matplotlib, para
+# no reconstruirlos en cada graficar().
+
+@dataclass
+class _Curva:
+    """Curva agregada con Lienzo.agregar()."""
+    __slots__ = ('funcion', 'etiqueta', 'color', 'anchoLinea', 'estiloLinea', 'rango', 'esOikos',
+                 'ufunc', 'kwargsPlot')
+    funcion: object
+    etiqueta: Optional[str]
+    color: Optional[str]
+    anchoLinea: float
+    estiloLinea: str
+    rango: Optional[Tuple[float, float]]
+    esOikos: bool
+    ufunc: Optional[np.ufunc]  # np.frompyfunc si la función no acepta arreglos (se detecta al graficar)
+
+    def __post_init__(self):
+        self.kwargsPlot = dict(
+            color=self.color,
+            linewidth=self.anchoLinea,
+            linestyle=self.estiloLinea,
+            label=self.etiqueta,
+            zorder=3
+        )
+
+
+@dataclass
+class _Punto:
+    """Punto agregado con Lienzo.agregarPunto()."""
+    __slots__ = ('x', 'y', 'etiqueta', 'color', 'dimension', 'marcador',
+                 'mostrarNombre', 'nombre', 'mostrarLineasGuia', 'kwargsPlot')
+    x: float
+    y: float
+    etiqueta: Optional[str]
+    color: Optional[str]
+    dimension: int
+    marcador: str
+    mostrarNombre: bool
+    nombre: Optional[str]
+    mostrarLineasGuia: bool
+
+    def __post_init__(self):
+        self.kwargsPlot = dict(
+            marker=self.marcador,
+            color=self.color,
+            markersize=self.dimension,
+            label=self.etiqueta,
+            zorder=5
+        )
+
+
+def _incluirEnLimites(ax, verticales, horizontales):
+    """
+    Hace que las líneas de referencia dibujadas como LineCollection cuenten
+    para el autoescalado, como lo hacen axvline (en x) y axhline (en y).
+    """
+    if verticales:
+        ax.update_datalim([(l.x, 0) for l in verticales], updatey=False)
+    if horizontales:
+        ax.update_datalim([(0, l.y) for l in horizontales], updatex=False)
+
+
+def _firmaLlamable(funcion):
+    """
+    Valores de los que depende una función de Python además de su código:
+    las variables de su closure, sus argumentos por defecto y las variables
+    globales que usa.
+
+    Se devuelven los valores mismos (se comparan con ==). Si alguno no es
+    hashable (ej. una lista o un arreglo de numpy) no se puede comparar de
+    forma fiable y se devuelve un objeto nuevo, que nunca coincide con la
+    firma anterior: guardar() vuelve a dibujar.
+    """
+    codigo = getattr(funcion, '__code__', None)
+    if codigo is None:
+        # ufuncs de numpy, partial, objetos invocables: solo su identidad
+        return None
+
+    globales = funcion.__globals__
+    try:
+        valores = (
+            tuple(celda.cell_contents for celda in funcion.__closure__ or ()),
+            funcion.__defaults__,
+            tuple(sorted((funcion.__kwdefaults__ or {}).items())),
+            tuple(globales[nombre] for nombre in codigo.co_names if nombre in globales),
+        )
+        hash(valores)
+    except (TypeError, ValueError):
+        # TypeError: valor no hashable; ValueError: celda del closure vacía
+        return object()
+    return valores
+
+
+def _guardarFigura(fig, ruta: str, kwargsGuardado: dict):
+    """Escribe la figura en ruta, convirtiendo los errores en ErrorGrafico."""
+    try:
+        fig.savefig(ruta, **kwargsGuardado)
+    except (OSError, ValueError) as e:
+        raise ErrorGrafico(f"No se pudo guardar la figura en '{ruta}': {e}") from e
+
+
+def _kwargsLineaReferencia(datosLinea) -> dict:
+    """Estilo común de las líneas verticales y horizontales de referencia."""
+    return dict(
+        color=datosLinea.color,
+        linestyle=datosLinea.estiloLinea,
+        alpha=0.5,
+        label=datosLinea.etiqueta,
+        zorder=2
+    )
+
+
+@dataclass
+class _LineaVertical:
+    """Línea vertical agregada con Lienzo.agregarLineaVertical()."""
+    __slots__ = ('x', 'etiqueta', 'color', 'estiloLinea', 'kwargsPlot')
+    x: float
+    etiqueta: Optional[str]
+    color: str
+    estiloLinea: str
+
+    def __post_init__(self):
+        self.kwargsPlot = _kwargsLineaReferencia(self)
+
+
+@dataclass
+class _LineaHorizontal:
+    """Línea horizontal agregada con Lienzo.agregarLineaHorizontal()."""
+    __slots__ = ('y', 'etiqueta', 'color', 'estiloLinea', 'kwargsPlot')
+    y: float
+    etiqueta: Optional[str]
+    color: str
+    estiloLinea: str
+
+    def __post_init__(self):
+        self.kwargsPlot = _kwargsLineaReferencia(self)
+
+
+@dataclass
+class _Relleno:
+    """Área de relleno agregada con Lienzo.agregarRelleno()."""
+    __slots__ = ('funcion1', 'funcion2', 'rangoX', 'color', 'alpha', 'etiqueta', 'kwargsPlot')
+    funcion1: object
+    funcion2: object
+    rangoX: Optional[Tuple[float, float]]
+    color: Optional[str]
+    alpha: float
+    etiqueta: Optional[str]
+
+    def __post_init__(self):
+        self.kwargsPlot = dict(
+            color=self.color,
+            alpha=self.alpha,
+            label=self.etiqueta,
+            zorder=1
+        )
+
+
+class _EstadoCuadrante:
+    """Configuración y elementos de una cuadrante en un Lienzo matricial."""
+    __slots__ = ('funciones', 'nEtiquetas', 'etiquetaX', 'etiquetaY', 'titulo', 'rangoX', 'rangoY',
+                 'pasoX', 'pasoY', 'indiceColor', 'alinearX', 'alinearY')
+
+    def __init__(self):
+        self.funciones = []
+        self.nEtiquetas = 0  # Elementos con etiqueta (para la leyenda)
+        self.etiquetaX = 'x'
+        self.etiquetaY = 'y'
+        self.titulo = ''
+        self.rangoX = None
+        self.rangoY = None
+        self.pasoX = None
+        self.pasoY = None
+        self.indiceColor = 0
+        self.alinearX = None
+        self.alinearY = None
+
+
 class Lienzo:
     """
     Lienzo flexible para gráficos económicos.
@@ -245,6 +701,7 @@ class Lienzo:
         relacionAspecto: "equal" (1:1) o "auto" (automático)
         matriz: (filas, columnas) para crear una matriz de secciones. Ej: (2, 2) para 4 cuadrantes
         dimensionMatriz: (ancho, alto) en pulgadas para figuras con matriz
+        persistente: Si True, graficar() reutiliza la misma figura en llamadas sucesivas
 
     Ejemplo:
         >>> import oikos as ok
@@ -274,16 +731,24 @@ class Lienzo:
                  matriz: Optional[Tuple[int, int]] = None,
                  dimensionMatriz: Optional[Tuple[int, int]] = None,
                  alinearEjes: bool = False,
-                 mostrarLeyenda: bool = False):
+                 mostrarLeyenda: bool = False,
+                 persistente: bool = False):
         """
         Inicializa un lienzo para gráficos económicos.
 
         Args:
             alinearEjes: Si True, alinea los ejes compartidos entre cuadrantes (útil para IS-LM)
             mostrarLeyenda: Si True, muestra la leyenda. Por defecto False para gráficos económicos limpios
+            persistente: Si True, las llamadas repetidas a graficar() limpian y redibujan
+                         los ejes existentes en lugar de crear una figura nueva (útil al
+                         ajustar parámetros en clase o con backends interactivos)
         """
         
-        self.estilo = estilo or EstiloGrafico()
+        self.estilo = estilo if estilo is not None else _ESTILO_DEFECTO
+
+        # Paleta como arreglo para asignar los colores automáticos de una vez
+        # (np.take con mode='wrap' recorre el ciclo)
+        self._cicloColores = np.array(self.estilo.paletaColores, dtype=object)
         self.cuadrantes = cuadrantes
         self.relacionAspecto = relacionAspecto
 
@@ -292,6 +757,7 @@ class Lienzo:
         self.dimensionMatriz = dimensionMatriz
         self.alinearEjes = alinearEjes
         self.mostrarLeyenda = mostrarLeyenda
+        self.persistente = persistente
 
         self.fig = None
         self.ax = None
@@ -299,7 +765,41 @@ class Lienzo:
         self._cuadrante_actual = None  # Para saber en qué cuadrante estamos trabajando
 
         self._funciones = []  # Lista de funciones a graficar
-        self._funciones_por_cuadrante = {}  # Diccionario {(fila, col): [funciones]}
+        self._nEtiquetas = 0  # Cuántas de ellas tienen etiqueta (para la leyenda)
+
+        # Estado de cada cuadrante, indexado como self._cuadrantes[fila][col]
+        if matriz:
+            filas, columnas = matriz
+            self._cuadrantes = [[_EstadoCuadrante() for _ in range(columnas)] for _ in range(filas)]
+        else:
+            self._cuadrantes = None
+
+        # Máscara de bits de cuadrantes usadas: bit (fila * columnas + col) activo
+        self._mascaraCuadrantes = 0
+
+        # Cómo evaluar cada objeto de oikos: id(obj) -> (obj, métodos)
+        self._cacheMetodos = {}
+
+        # Mallas de x ya construidas: (xMin, xMax, nMuestras) -> arreglo de solo lectura
+        self._cacheMallas = {}
+
+        # Modo persistente: líneas de las curvas del último dibujo y la firma
+        # (ver _firmaActual) con la que se dibujaron
+        self._lineasCurvas = {}
+        self._firmaDibujo = None
+
+        # True si algo cambió (por los métodos del Lienzo) desde el último
+        # graficar(). Junto con la firma de _firmaEstado() tomada al dibujar,
+        # decide si guardar() puede reutilizar self.fig (ver _figuraAlDia)
+        self._sucio = True
+        self._firmaGuardado = None
+
+        # Evaluaciones hechas durante el graficar() en curso:
+        # (id(funcion), xMin, xMax, nMuestras) -> valoresY
+        self._cacheEvaluacion = {}
+
+        # Colores automáticos ya usados en el modo simple (en el modo matricial
+        # cada cuadrante lleva su propia cuenta)
         self._indiceColor = 0
 
         # Configuración de ejes
@@ -338,41 +838,29 @@ class Lienzo:
         if not self.matriz:
             raise ValueError("Este lienzo no tiene una matriz de cuadrantes. Usa matriz=(filas, cols) al crear el Lienzo.")
 
+        filas, columnas = self.matriz
+
+        # Validar índices (1-indexed)
+        if not (1 <= fila <= filas and 1 <= columna <= columnas):
+            raise ValueError(
+                f"Cuadrante ({fila}, {columna}) fuera de rango. "
+                f"La fila debe estar entre 1 y {filas} y la columna entre 1 y {columnas}."
+            )
+
         # Convertir de 1-indexed a 0-indexed
         filaIdx = fila - 1
         columnaIdx = columna - 1
 
-        # Validar índices
-        if fila < 1 or fila > self.matriz[0]:
-            raise ValueError(f"Fila {fila} fuera de rango. Debe estar entre 1 y {self.matriz[0]}.")
-        if columna < 1 or columna > self.matriz[1]:
-            raise ValueError(f"Columna {columna} fuera de rango. Debe estar entre 1 y {self.matriz[1]}.")
-
-        # Validar alineación de ejes con vecinos tipo torre (knn=1)
-        alinearXValidado = None
-        alinearYValidado = None
-
-        if alinearX:
-            if alinearX == 'ARRIBA' and fila > 1:
-                # Verificar que existe vecino arriba
-                alinearXValidado = 'ARRIBA'
-            elif alinearX == 'ABAJO' and fila < self.matriz[0]:
-                # Verificar que existe vecino abajo
-                alinearXValidado = 'ABAJO'
-            elif alinearX in ['ARRIBA', 'ABAJO']:
-                # No tiene vecino en esa dirección, ignorar
-                pass
-
-        if alinearY:
-            if alinearY == 'IZQUIERDA' and columna > 1:
-                # Verificar que existe vecino a la izquierda
-                alinearYValidado = 'IZQUIERDA'
-            elif alinearY == 'DERECHA' and columna < self.matriz[1]:
-                # Verificar que existe vecino a la derecha
-                alinearYValidado = 'DERECHA'
-            elif alinearY in ['IZQUIERDA', 'DERECHA']:
-                # No tiene vecino en esa dirección, ignorar
-                pass
+        # Validar alineación de ejes con vecinos tipo torre (knn=1):
+        # si no hay vecino en esa dirección la alineación se ignora
+        tieneVecino = {
+            ARRIBA: fila > 1,
+            ABAJO: fila < filas,
+            IZQUIERDA: columna > 1,
+            DERECHA: columna < columnas,
+        }
+        alinearXValidado = alinearX if alinearX in (ARRIBA, ABAJO) and tieneVecino[alinearX] else None
+        alinearYValidado = alinearY if alinearY in (IZQUIERDA, DERECHA) and tieneVecino[alinearY] else None
 
         self._cuadrante_actual = (filaIdx, columnaIdx)
 
@@ -385,25 +873,12 @@ class Lienzo:
         self.pasoX = None
         self.pasoY = None
 
-        # Inicializar lista de funciones para esta cuadrante si no existe
-        if self._cuadrante_actual not in self._funciones_por_cuadrante:
-            self._funciones_por_cuadrante[self._cuadrante_actual] = {
-                'funciones': [],
-                'etiquetaX': 'x',
-                'etiquetaY': 'y',
-                'titulo': '',
-                'rangoX': None,
-                'rangoY': None,
-                'pasoX': None,
-                'pasoY': None,
-                'indiceColor': 0,
-                'alinearX': alinearXValidado,
-                'alinearY': alinearYValidado
-            }
-        else:
-            # Actualizar alineación si ya existe
-            self._funciones_por_cuadrante[self._cuadrante_actual]['alinearX'] = alinearXValidado
-            self._funciones_por_cuadrante[self._cuadrante_actual]['alinearY'] = alinearYValidado
+        # Marcar la cuadrante como usada y actualizar su alineación
+        self._mascaraCuadrantes |= 1 << (filaIdx * columnas + columnaIdx)
+        estado = self._cuadrantes[filaIdx][columnaIdx]
+        estado.alinearX = alinearXValidado
+        estado.alinearY = alinearYValidado
+        self._sucio = True
 
         return self
 
@@ -431,13 +906,15 @@ class Lienzo:
 
         # Si estamos en modo matricial, guardar configuración para la cuadrante actual
         if self.matriz and self._cuadrante_actual:
+            estado = self._estadoCuadranteActual()
             if etiquetaX:
-                self._funciones_por_cuadrante[self._cuadrante_actual]['etiquetaX'] = etiquetaX
+                estado.etiquetaX = etiquetaX
             if etiquetaY:
-                self._funciones_por_cuadrante[self._cuadrante_actual]['etiquetaY'] = etiquetaY
+                estado.etiquetaY = etiquetaY
             if titulo:
-                self._funciones_por_cuadrante[self._cuadrante_actual]['titulo'] = titulo
+                estado.titulo = titulo
 
+        self._sucio = True
         return self
     
     def configurarRango(self, 
@@ -455,6 +932,7 @@ class Lienzo:
         """
         self.rangoX = rangoX
         self.rangoY = rangoY
+        self._sucio = True
         return self
     
     def configurarPasos(self, pasoX: float = None, pasoY: float = None):
@@ -470,6 +948,7 @@ class Lienzo:
         """
         self.pasoX = pasoX
         self.pasoY = pasoY
+        self._sucio = True
         return self
     
     def agregar(self,
@@ -523,30 +1002,19 @@ class Lienzo:
         elif tipoFuncion == 'oferta':
             colorFinal = COLOR_OFERTA
         else:
-            # Si estamos en modo matricial, usar el índice de color de la cuadrante actual
-            if self.matriz and self._cuadrante_actual:
-                cuadranteInfo = self._funciones_por_cuadrante[self._cuadrante_actual]
-                colorFinal = self.estilo.paletaColores[cuadranteInfo['indiceColor'] % len(self.estilo.paletaColores)]
-                cuadranteInfo['indiceColor'] += 1
-            else:
-                colorFinal = self._obtenerSiguienteColor()
-
-        datosFuncion = {
-            'funcion': funcion,
-            'etiqueta': etiqueta or self._generarEtiqueta(funcion),
-            'color': colorFinal,
-            'anchoLinea': anchoLinea or self.estilo.anchoLinea,
-            'estiloLinea': estiloLinea,
-            'rango': rangoPersonalizado,
-            'esOikos': esObjetoOikos,
-            'tipo': 'curva'
-        }
-
-        # Guardar en la cuadrante actual o en la lista general
-        if self.matriz and self._cuadrante_actual:
-            self._funciones_por_cuadrante[self._cuadrante_actual]['funciones'].append(datosFuncion)
-        else:
-            self._funciones.append(datosFuncion)
+            # Color automático de la paleta: se asigna al graficar (_asignarColores)
+            colorFinal = None
+
+        self._registrar(_Curva(
+            funcion=funcion,
+            etiqueta=etiqueta or self._generarEtiqueta(funcion),
+            color=colorFinal,
+            anchoLinea=anchoLinea or self.estilo.anchoLinea,
+            estiloLinea=estiloLinea,
+            rango=rangoPersonalizado,
+            esOikos=esObjetoOikos,
+            ufunc=None
+        ))
 
         return self
     
@@ -583,24 +1051,17 @@ class Lienzo:
             >>> lienzo.agregarPunto(50, 25, etiqueta="Equilibrio", color=ok.VERDE,
             ...                     mostrarNombre=True, nombre="$E_0$")
         """
-        datosPunto = {
-            'x': x,
-            'y': y,
-            'etiqueta': etiqueta,
-            'color': color or self._obtenerSiguienteColor(),
-            'dimension': dimension,
-            'marcador': marcador,
-            'mostrarNombre': mostrarNombre,
-            'nombre': nombre,
-            'mostrarLineasGuia': mostrarLineasGuia,
-            'tipo': 'punto'
-        }
-
-        # Guardar en la cuadrante actual o en la lista general
-        if self.matriz and self._cuadrante_actual:
-            self._funciones_por_cuadrante[self._cuadrante_actual]['funciones'].append(datosPunto)
-        else:
-            self._funciones.append(datosPunto)
+        self._registrar(_Punto(
+            x=x,
+            y=y,
+            etiqueta=etiqueta,
+            color=color or None,  # None: color automático al graficar
+            dimension=dimension,
+            marcador=marcador,
+            mostrarNombre=mostrarNombre,
+            nombre=nombre,
+            mostrarLineasGuia=mostrarLineasGuia
+        ))
 
         return self
     
@@ -621,19 +1082,12 @@ class Lienzo:
         Returns:
             self (para encadenar métodos)
         """
-        datosLinea = {
-            'x': x,
-            'etiqueta': etiqueta,
-            'color': color,
-            'estiloLinea': estiloLinea,
-            'tipo': 'linea_vertical'
-        }
-
-        # Guardar en la cuadrante actual o en la lista general
-        if self.matriz and self._cuadrante_actual:
-            self._funciones_por_cuadrante[self._cuadrante_actual]['funciones'].append(datosLinea)
-        else:
-            self._funciones.append(datosLinea)
+        self._registrar(_LineaVertical(
+            x=x,
+            etiqueta=etiqueta,
+            color=color,
+            estiloLinea=estiloLinea
+        ))
 
         return self
 
@@ -654,19 +1108,12 @@ class Lienzo:
         Returns:
             self (para encadenar métodos)
         """
-        datosLinea = {
-            'y': y,
-            'etiqueta': etiqueta,
-            'color': color,
-            'estiloLinea': estiloLinea,
-            'tipo': 'linea_horizontal'
-        }
-
-        # Guardar en la cuadrante actual o en la lista general
-        if self.matriz and self._cuadrante_actual:
-            self._funciones_por_cuadrante[self._cuadrante_actual]['funciones'].append(datosLinea)
-        else:
-            self._funciones.append(datosLinea)
+        self._registrar(_LineaHorizontal(
+            y=y,
+            etiqueta=etiqueta,
+            color=color,
+            estiloLinea=estiloLinea
+        ))
 
         return self
     
@@ -704,21 +1151,14 @@ class Lienzo:
             ...     etiqueta="Excedente Consumidor"
             ... )
         """
-        datosRelleno = {
-            'funcion1': funcion1,
-            'funcion2': funcion2,
-            'rangoX': rangoX,
-            'color': color or self._obtenerSiguienteColor(),
-            'alpha': alpha or self.estilo.alphaRelleno,
-            'etiqueta': etiqueta,
-            'tipo': 'relleno'
-        }
-
-        # Guardar en la cuadrante actual o en la lista general
-        if self.matriz and self._cuadrante_actual:
-            self._funciones_por_cuadrante[self._cuadrante_actual]['funciones'].append(datosRelleno)
-        else:
-            self._funciones.append(datosRelleno)
+        self._registrar(_Relleno(
+            funcion1=funcion1,
+            funcion2=funcion2,
+            rangoX=rangoX,
+            color=color or None,  # None: color automático al graficar
+            alpha=alpha or self.estilo.alphaRelleno,
+            etiqueta=etiqueta
+        ))
 
         return self
     
@@ -732,44 +1172,53 @@ class Lienzo:
         Returns:
             (fig, ax) o (fig, axes) - La figura y ejes de matplotlib
         """
-        # Si es modo matricial
-        if self.matriz:
-            return self._graficarMatriz(mostrar)
-
-        # Modo simple (un solo gráfico)
-        # Crear figura
-        self.fig, self.ax = plt.subplots(
-            figsize=self.estilo.dimensionFigura,
-            dpi=self.estilo.dpi
-        )
+        # Las evaluaciones solo se reutilizan dentro de un mismo dibujo: la
+        # función (o el objeto de oikos) puede haber cambiado desde el anterior
+        self._cacheEvaluacion.clear()
+
+        # Los rcParams del estilo solo rigen mientras se dibuja este Lienzo
+        with self._contextoRc():
+            # Si es modo matricial
+            if self.matriz:
+                return self._graficarMatriz(mostrar)
+            return self._graficarSimple(mostrar)
+
+    def _graficarSimple(self, mostrar: bool = True):
+        """
+        Genera el gráfico en modo simple (un solo eje).
+        """
+        import matplotlib.pyplot as plt
 
-        # Configurar estilo general
-        self._configurarEstiloGeneral(self.ax)
+        # Reutilizar la figura anterior (modo persistente) o crear una nueva
+        reutilizada = self._figuraReutilizable()
 
-        # Configurar cuadrantes
-        self._configurarCuadrantes(self.ax)
+        # Si solo cambiaron datos (ej. rangoX), actualizar las curvas existentes
+        if reutilizada and self._actualizarCurvas():
+            self._marcarDibujado()
+            self.fig.canvas.draw_idle()
+            if mostrar:
+                plt.show()
+            return self.fig, self.ax
 
-        # Graficar todas las funciones
-        self._graficarFunciones(self.ax, self._funciones)
+        if reutilizada:
+            self.ax.cla()
+        else:
+            # Un solo eje: plt.figure + add_subplot evita la maquinaria de
+            # rejillas de plt.subplots (la figura sigue registrada en pyplot
+            # para poder mostrarla)
+            self.fig = plt.figure(
+                figsize=self.estilo.dimensionFigura,
+                dpi=self.estilo.dpi,
+                layout='constrained'
+            )
+            self.ax = self.fig.add_subplot()
 
-        # Configurar ejes y etiquetas
-        self._configurarEjes(self.ax, self.etiquetaX, self.etiquetaY, self.titulo,
-                           self.rangoX, self.rangoY)
+        self._lineasCurvas = self._dibujarSimple(self.ax)
+        self._firmaDibujo = self._firmaActual()
+        self._marcarDibujado()
 
-        # Añadir leyenda solo si está activada y hay etiquetas
-        if self.mostrarLeyenda:
-            etiquetasExistentes = [f['etiqueta'] for f in self._funciones if f.get('etiqueta')]
-            if etiquetasExistentes:
-                self.ax.legend(
-                    fontsize=self.estilo.dimensionLeyenda,
-                    framealpha=0.9,
-                    loc='upper center',
-                    bbox_to_anchor=(0.5, -0.1),
-                    ncol=min(3, len(etiquetasExistentes))
-                )
-
-        # Ajustar diseño
-        plt.tight_layout()
+        if reutilizada:
+            self.fig.canvas.draw_idle()
 
         if mostrar:
             plt.show()
@@ -780,281 +1229,637 @@ class Lienzo:
         """
         Genera gráficos en modo matricial.
         """
+        import matplotlib.pyplot as plt
+
         filas, columnas = self.matriz
         figsize = self.dimensionMatriz or (6 * columnas, 5 * filas)
 
+        # Reutilizar la figura anterior (modo persistente) o crear una nueva
+        reutilizada = self._figuraReutilizable()
+        if reutilizada:
+            for ax in self.axes.flat:
+                ax.cla()
+                # Una cuadrante vacía en el dibujo anterior puede tener datos ahora
+                ax.set_visible(True)
         # Si se requiere alineación de ejes, usar sharex y sharey
-        if self.alinearEjes:
+        # (squeeze=False garantiza que axes sea siempre un arreglo 2D)
+        elif self.alinearEjes:
             self.fig, self.axes = plt.subplots(
                 filas, columnas,
                 figsize=figsize,
                 dpi=self.estilo.dpi,
                 sharex='col',  # Compartir eje X por columnas
-                sharey='row'   # Compartir eje Y por filas
+                sharey='row',  # Compartir eje Y por filas
+                squeeze=False,
+                layout='constrained'
             )
         else:
             self.fig, self.axes = plt.subplots(
                 filas, columnas,
                 figsize=figsize,
-                dpi=self.estilo.dpi
+                dpi=self.estilo.dpi,
+                squeeze=False,
+                layout='constrained'
             )
 
-        # Asegurar que axes sea siempre 2D
-        if filas == 1 and columnas == 1:
-            self.axes = np.array([[self.axes]])
-        elif filas == 1:
-            self.axes = self.axes.reshape(1, -1)
-        elif columnas == 1:
-            self.axes = self.axes.reshape(-1, 1)
-
-        # Graficar cada cuadrante
-        for (fila, col), cuadranteData in self._funciones_por_cuadrante.items():
-            ax = self.axes[fila, col]
-
-            # Configurar estilo general
-            self._configurarEstiloGeneral(ax)
-
-            # Configurar cuadrantes
-            self._configurarCuadrantes(ax)
-
-            # Graficar funciones de esta cuadrante
-            self._graficarFunciones(ax, cuadranteData['funciones'])
-
-            # Configurar ejes y etiquetas
-            self._configurarEjes(
-                ax,
-                cuadranteData['etiquetaX'],
-                cuadranteData['etiquetaY'],
-                cuadranteData['titulo'],
-                cuadranteData['rangoX'],
-                cuadranteData['rangoY']
+        self._dibujarMatriz(self.axes)
+        self._marcarDibujado()
+
+        if reutilizada:
+            self.fig.canvas.draw_idle()
+
+        if mostrar:
+            plt.show()
+
+        return self.fig, self.axes
+
+    def guardar(self, ruta: str, **kwargsGuardado):
+        """
+        Guarda el gráfico en un archivo sin mostrarlo.
+
+        Si ya se llamó a graficar() y desde entonces no se agregaron
+        elementos ni se cambió la configuración (ni la ecuación de los objetos
+        de oikos graficados, ni los valores que usan las funciones de Python),
+        se guarda esa misma figura.
+        Si no, la figura se dibuja directamente con el backend Agg (sin pasar
+        por pyplot), así que no se abre ninguna ventana, no se registra en las
+        figuras de pyplot y no depende del backend interactivo activo.
+
+        Args:
+            ruta: Archivo de destino (el formato se deduce de la extensión:
+                  .png, .pdf, .svg, ...)
+            **kwargsGuardado: Argumentos adicionales para Figure.savefig
+                              (ej. dpi=300, transparent=True)
+
+        Returns:
+            (fig, ax) o (fig, axes) - La figura y ejes de matplotlib
+
+        Raises:
+            ErrorGrafico: Si no se pudo escribir el archivo
+
+        Ejemplo:
+            >>> lienzo.guardar("mercado.png", dpi=300)
+        """
+        # Los rcParams del estilo solo rigen mientras se dibuja y se escribe el archivo
+        with self._contextoRc():
+            # Nada cambió desde graficar(): guardar la figura ya dibujada
+            if self._figuraAlDia():
+                _guardarFigura(self.fig, ruta, kwargsGuardado)
+                return self.fig, (self.axes if self.matriz else self.ax)
+
+            return self._guardarFiguraNueva(ruta, kwargsGuardado)
+
+    def _guardarFiguraNueva(self, ruta: str, kwargsGuardado: dict):
+        """Dibuja el Lienzo en una figura Agg nueva (fuera de pyplot) y la guarda."""
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+        self._cacheEvaluacion.clear()
+
+        # La figura se crea directamente con la resolución del archivo, así el
+        # número de muestras por curva se ajusta a los píxeles reales
+        dpi = kwargsGuardado.get('dpi')
+        if not isinstance(dpi, (int, float)):
+            dpi = self.estilo.dpi
+
+        if self.matriz:
+            filas, columnas = self.matriz
+            fig = Figure(
+                figsize=self.dimensionMatriz or (6 * columnas, 5 * filas),
+                dpi=dpi,
+                layout='constrained'
+            )
+            ejes = fig.subplots(
+                filas, columnas,
+                sharex='col' if self.alinearEjes else False,
+                sharey='row' if self.alinearEjes else False,
+                squeeze=False
+            )
+            self._dibujarMatriz(ejes)
+        else:
+            fig = Figure(
+                figsize=self.estilo.dimensionFigura,
+                dpi=dpi,
+                layout='constrained'
             )
+            ejes = fig.add_subplot()
+            self._dibujarSimple(ejes)
 
-            # Añadir leyenda solo si está activada y hay etiquetas
-            if self.mostrarLeyenda:
-                etiquetasExistentes = [f['etiqueta'] for f in cuadranteData['funciones'] if f.get('etiqueta')]
-                if etiquetasExistentes:
-                    ax.legend(
-                        fontsize=self.estilo.dimensionLeyenda,
-                        framealpha=0.9,
-                        loc='upper center',
-                        bbox_to_anchor=(0.5, -0.1),
-                        ncol=min(3, len(etiquetasExistentes))
-                    )
+        FigureCanvasAgg(fig)
+        _guardarFigura(fig, ruta, kwargsGuardado)
+
+        return fig, ejes
+    
+    # ========== MÉTODOS PRIVADOS ==========
+
+    def _dibujarSimple(self, ax) -> dict:
+        """
+        Dibuja todos los elementos en el eje del modo simple.
+
+        Returns:
+            {id(curva): Line2D} de las curvas dibujadas
+        """
+        # Configurar estilo general
+        self._configurarEstiloGeneral(ax)
+
+        # Configurar cuadrantes
+        self._configurarCuadrantes(ax)
+
+        # Graficar todas las funciones
+        self._indiceColor = self._asignarColores(self._funciones, self._indiceColor)
+        lineasCurvas = self._graficarFunciones(ax, self._funciones)
+
+        # Configurar ejes y etiquetas
+        self._configurarEjes(ax, self.etiquetaX, self.etiquetaY, self.titulo,
+                           self.rangoX, self.rangoY)
+
+        # Añadir leyenda solo si está activada y hay etiquetas
+        if self.mostrarLeyenda and self._nEtiquetas:
+            self._agregarLeyenda(ax, self._funciones, self._nEtiquetas)
+
+        return lineasCurvas
+
+    def _actualizarCurvas(self) -> bool:
+        """
+        Redibujo rápido del modo persistente: si desde el último graficar()
+        no se agregaron elementos ni cambió el estilo, solo se recalculan
+        las curvas y se actualizan sus líneas con set_data, sin limpiar el eje.
+
+        Returns:
+            True si se pudo actualizar así; False si hay que redibujar todo
+        """
+        if self._firmaDibujo != self._firmaActual():
+            return False
+
+        # Los rellenos no se pueden actualizar en el lugar: redibujo completo
+        curvas = []
+        for datosFuncion in self._funciones:
+            tipo = type(datosFuncion)
+            if tipo is _Relleno:
+                return False
+            if tipo is _Curva:
+                if id(datosFuncion) not in self._lineasCurvas:
+                    return False
+                curvas.append(datosFuncion)
+
+        muestras = self._muestrearCurvas(self.ax, curvas)
+        for datosFuncion in curvas:
+            valoresX, valoresY, finitos = muestras[id(datosFuncion)]
+            self._lineasCurvas[id(datosFuncion)].set_data(valoresX[finitos], valoresY[finitos])
+
+        # Recalcular los límites con los datos nuevos y reaplicar etiquetas/rangos
+        # (relim no mira las LineCollection de líneas de referencia sin etiqueta)
+        self.ax.relim()
+        _incluirEnLimites(
+            self.ax,
+            [d for d in self._funciones if type(d) is _LineaVertical and not d.etiqueta],
+            [d for d in self._funciones if type(d) is _LineaHorizontal and not d.etiqueta]
+        )
+        self._configurarEjes(self.ax, self.etiquetaX, self.etiquetaY, self.titulo,
+                             self.rangoX, self.rangoY)
+        return True
+
+    def _marcarDibujado(self):
+        """Registra que self.fig muestra el estado actual del Lienzo."""
+        self._sucio = False
+        self._firmaGuardado = self._firmaEstado()
+
+    def _figuraAlDia(self) -> bool:
+        """Indica si self.fig sigue mostrando el estado actual (guardar() la reutiliza)."""
+        return (
+            self.fig is not None
+            and not self._sucio
+            and self._firmaGuardado == self._firmaEstado()
+        )
+
+    def _firmaEstado(self) -> tuple:
+        """
+        Lo que puede cambiar sin pasar por los métodos del Lienzo: los
+        atributos públicos, las expresiones de los objetos de oikos graficados
+        y los valores de los que dependen las funciones de Python (ver
+        _firmaLlamable).
+        """
+        if self.matriz:
+            elementos = [d for fila in self._cuadrantes for estado in fila for d in estado.funciones]
+        else:
+            elementos = self._funciones
+
+        objetos = [
+            objeto
+            for datos in elementos
+            for campo in ('funcion', 'funcion1', 'funcion2')
+            for objeto in (getattr(datos, campo, None),)
+            if objeto is not None
+        ]
+        expresiones = tuple(hash(o.expresion) for o in objetos if hasattr(o, 'expresion'))
+        llamables = tuple(
+            _firmaLlamable(o) for o in objetos
+            if callable(o) and not hasattr(o, 'expresion')
+        )
+        return (
+            self.titulo, self.etiquetaX, self.etiquetaY,
+            self.rangoX, self.rangoY, self.pasoX, self.pasoY,
+            self.mostrarLeyenda, self.estilo, expresiones, llamables
+        )
+
+    def _firmaActual(self) -> tuple:
+        """Lo que debe coincidir con el dibujo anterior para poder actualizarlo."""
+        # Los elementos solo se agregan (nunca se quitan), basta con contarlos
+        return (len(self._funciones), self.estilo, self.mostrarLeyenda)
+
+    def _dibujarMatriz(self, axes):
+        """Dibuja las cuadrantes usadas en la matriz de ejes (arreglo 2D)."""
+        filas, columnas = self.matriz
+
+        # Graficar cada cuadrante usada
+        for fila, col in self._cuadrantesUsadas():
+            self._graficarCuadrante(axes[fila, col], self._cuadrantes[fila][col])
 
         # APLICAR ALINEACIÓN ESPECÍFICA DE EJES ENTRE CUADRANTES
-        for (fila, col), cuadranteData in self._funciones_por_cuadrante.items():
-            axActual = self.axes[fila, col]
+        for fila, col in self._cuadrantesUsadas():
+            cuadranteData = self._cuadrantes[fila][col]
+            axActual = axes[fila, col]
 
             # Alinear eje X con vecino ARRIBA o ABAJO
-            if cuadranteData.get('alinearX'):
-                if cuadranteData['alinearX'] == 'ARRIBA' and fila > 0:
-                    axVecino = self.axes[fila - 1, col]
-                    axActual.sharex(axVecino)
-                elif cuadranteData['alinearX'] == 'ABAJO' and fila < filas - 1:
-                    axVecino = self.axes[fila + 1, col]
-                    axActual.sharex(axVecino)
+            axVecino = None
+            if cuadranteData.alinearX == 'ARRIBA' and fila > 0:
+                axVecino = axes[fila - 1, col]
+            elif cuadranteData.alinearX == 'ABAJO' and fila < filas - 1:
+                axVecino = axes[fila + 1, col]
+            # matplotlib no permite compartir dos veces (figura reutilizada o alinearEjes)
+            if axVecino is not None and not axActual.get_shared_x_axes().joined(axActual, axVecino):
+                axActual.sharex(axVecino)
 
             # Alinear eje Y con vecino IZQUIERDA o DERECHA
-            if cuadranteData.get('alinearY'):
-                if cuadranteData['alinearY'] == 'IZQUIERDA' and col > 0:
-                    axVecino = self.axes[fila, col - 1]
-                    axActual.sharey(axVecino)
-                elif cuadranteData['alinearY'] == 'DERECHA' and col < columnas - 1:
-                    axVecino = self.axes[fila, col + 1]
-                    axActual.sharey(axVecino)
-
-        # Ocultar cuadrantes vacías
-        for fila in range(filas):
-            for col in range(columnas):
-                if (fila, col) not in self._funciones_por_cuadrante:
-                    self.axes[fila, col].axis('off')
-
-        # Ajustar diseño
-        plt.tight_layout()
+            axVecino = None
+            if cuadranteData.alinearY == 'IZQUIERDA' and col > 0:
+                axVecino = axes[fila, col - 1]
+            elif cuadranteData.alinearY == 'DERECHA' and col < columnas - 1:
+                axVecino = axes[fila, col + 1]
+            if axVecino is not None and not axActual.get_shared_y_axes().joined(axActual, axVecino):
+                axActual.sharey(axVecino)
+
+        # Ocultar cuadrantes vacías: recorremos solo los bits del complemento
+        # de la máscara y ocultamos el eje completo (más barato que axis('off'))
+        vacias = ~self._mascaraCuadrantes & ((1 << (filas * columnas)) - 1)
+        while vacias:
+            bit = vacias & -vacias
+            axes[divmod(bit.bit_length() - 1, columnas)].set_visible(False)
+            vacias ^= bit
+
+    def _graficarCuadrante(self, ax, cuadranteData):
+        """Grafica una cuadrante de la matriz."""
+        # Configurar estilo general
+        self._configurarEstiloGeneral(ax)
 
-        if mostrar:
-            plt.show()
+        # Configurar cuadrantes
+        self._configurarCuadrantes(ax)
 
-        return self.fig, self.axes
-    
-    # ========== MÉTODOS PRIVADOS ==========
+        # Graficar funciones de esta cuadrante (con su propio ciclo de colores)
+        cuadranteData.indiceColor = self._asignarColores(cuadranteData.funciones, cuadranteData.indiceColor)
+        self._graficarFunciones(ax, cuadranteData.funciones)
 
-    def _configurarEstiloGeneral(self, ax):
-        """Configura el estilo general del gráfico."""
-        ax.set_facecolor(self.estilo.colorFondo)
+        # Configurar ejes y etiquetas
+        self._configurarEjes(
+            ax,
+            cuadranteData.etiquetaX,
+            cuadranteData.etiquetaY,
+            cuadranteData.titulo,
+            cuadranteData.rangoX,
+            cuadranteData.rangoY
+        )
 
-        # Grid con estilo mejorado (cuadrados)
-        ax.grid(
-            True,
-            alpha=self.estilo.alphaGrid,
-            linestyle=self.estilo.estiloLineaGrid,
-            linewidth=self.estilo.anchoGrid,
-            color=self.estilo.colorGrid
+        # Añadir leyenda solo si está activada y hay etiquetas
+        if self.mostrarLeyenda and cuadranteData.nEtiquetas:
+            self._agregarLeyenda(ax, cuadranteData.funciones, cuadranteData.nEtiquetas)
+
+    def _agregarLeyenda(self, ax, funciones, nEtiquetas: int):
+        """
+        Añade la leyenda con las entradas en el orden en que se agregaron los
+        elementos (el dibujo los agrupa por tipo, ver _GRAFICADORES).
+        """
+        orden = {}
+        for indice, datos in enumerate(funciones):
+            if datos.etiqueta:
+                orden.setdefault(datos.etiqueta, indice)
+
+        # sorted es estable: entradas con la misma etiqueta conservan su orden
+        manejadores, etiquetas = ax.get_legend_handles_labels()
+        entradas = sorted(
+            zip(manejadores, etiquetas),
+            key=lambda entrada: orden.get(entrada[1], len(funciones))
+        )
+
+        ax.legend(
+            [manejador for manejador, _ in entradas],
+            [etiqueta for _, etiqueta in entradas],
+            fontsize=self.estilo.dimensionLeyenda,
+            framealpha=0.9,
+            loc='upper center',
+            bbox_to_anchor=(0.5, -0.1),
+            ncol=min(3, nEtiquetas)
         )
 
-        # Configurar fuentes
-        plt.rcParams['font.family'] = self.estilo.familiaFuente
+    def _figuraReutilizable(self) -> bool:
+        """Indica si graficar() puede redibujar sobre la figura anterior."""
+        if not self.persistente or self.fig is None:
+            return False
+
+        # Si la figura se cerró (ej. backend inline tras mostrarla) hay que crear otra
+        import matplotlib.pyplot as plt
+        return plt.fignum_exists(self.fig.number)
+
+    def _cuadrantesUsadas(self):
+        """Itera (fila, col) de las cuadrantes usadas, recorriendo solo los bits activos."""
+        columnas = self.matriz[1]
+        mascara = self._mascaraCuadrantes
+        while mascara:
+            bit = mascara & -mascara  # bit activo más bajo
+            yield divmod(bit.bit_length() - 1, columnas)
+            mascara ^= bit
+
+    def _estadoCuadranteActual(self) -> _EstadoCuadrante:
+        """Devuelve el estado de la cuadrante seleccionada con cuadrante()."""
+        fila, columna = self._cuadrante_actual
+        return self._cuadrantes[fila][columna]
+
+    def _registrar(self, datos):
+        """Guarda un elemento en la cuadrante actual o en la lista general."""
+        tieneEtiqueta = 1 if datos.etiqueta else 0
+        self._sucio = True
+
+        if self.matriz and self._cuadrante_actual:
+            estado = self._estadoCuadranteActual()
+            estado.funciones.append(datos)
+            estado.nEtiquetas += tieneEtiqueta
+        else:
+            self._funciones.append(datos)
+            self._nEtiquetas += tieneEtiqueta
+
+    def _contextoRc(self):
+        """
+        Contexto con los rcParams que dependen del estilo.
 
-        # Hacer que los ejes tengan el mismo aspecto (cuadrados en el grid)
-        ax.set_aspect('auto')
+        Se aplican solo mientras se dibuja (rc_context restaura los valores
+        al salir), así no alteran otras figuras de matplotlib del usuario.
+        """
+        import matplotlib
+
+        estilo = self.estilo
+        return matplotlib.rc_context({
+            'font.family': estilo.familiaFuente,
+            # Desactivar LaTeX en matplotlib
+            'text.usetex': False,
+            # Simplificación de trazos: menos vértices que rasterizar por curva
+            'path.simplify': estilo.simplificarTrazos,
+            'path.simplify_threshold': estilo.umbralSimplificacion,
+        })
+
+    def _configurarEstiloGeneral(self, ax):
+        """Configura el estilo general del gráfico."""
+        # Fondo y aspecto de los ejes en una sola llamada
+        ax.set(facecolor=self.estilo.colorFondo, aspect='auto')
+
+        # Grid con estilo mejorado (cuadrados)
+        grid = _configuracionEjes(self.estilo)[0]
+        ax.grid(True, **grid)
 
     def _configurarCuadrantes(self, ax):
         """Configura los cuadrantes visibles con estilo de bordes completos."""
-        # Mostrar todos los bordes (estilo de cuadro)
-        ax.spines['top'].set_visible(True)
-        ax.spines['right'].set_visible(True)
-        ax.spines['bottom'].set_visible(True)
-        ax.spines['left'].set_visible(True)
-
-        # Aplicar estilos a todos los spines
-        for spine in ['top', 'right', 'bottom', 'left']:
-            ax.spines[spine].set_linewidth(self.estilo.anchoEje)
-            ax.spines[spine].set_color(self.estilo.colorEje)
+        # Mostrar todos los bordes (estilo de cuadro) con el mismo estilo
+        bordes = _configuracionEjes(self.estilo)[1]
+        ax.spines[:].set(**bordes)
 
     def _configurarEjes(self, ax, etiquetaX, etiquetaY, titulo, rangoX, rangoY):
         """Configura las etiquetas y rangos de los ejes."""
-        # Desactivar LaTeX en matplotlib
-        plt.rcParams['text.usetex'] = False
-
-        # Etiquetas (sin LaTeX)
-        ax.set_xlabel(
-            etiquetaX,
-            fontsize=self.estilo.dimensionLabel,
-            fontweight=self.estilo.pesoFuenteLabel
-        )
-        ax.set_ylabel(
-            etiquetaY,
-            fontsize=self.estilo.dimensionLabel,
-            fontweight=self.estilo.pesoFuenteLabel
-        )
+        _, _, fuenteLabel, fuenteTitulo = _configuracionEjes(self.estilo)
+
+        # Etiquetas (sin LaTeX), ambas con la misma fuente
+        ax.set_xlabel(etiquetaX, **fuenteLabel)
+        ax.set_ylabel(etiquetaY, **fuenteLabel)
 
         # Título
         if titulo:
-            ax.set_title(
-                titulo,
-                fontsize=self.estilo.dimensionTitulo,
-                fontweight=self.estilo.pesoFuenteTitulo,
-                pad=15
-            )
+            ax.set_title(titulo, pad=15, **fuenteTitulo)
 
         # RANGOS AUTOMÁTICOS (v0.3.1)
-        # Las gráficas DEBEN ocupar TODO el espacio sin dejar márgenes
-        if not rangoX or not rangoY:
-            # Obtener los límites actuales de matplotlib (basados en los datos graficados)
-            xlimActual = ax.get_xlim()
-            ylimActual = ax.get_ylim()
-
-            # Usar rangos exactos de los datos para ocupar TODO el cuadro
-            if not rangoX:
-                xMin, xMax = xlimActual
-                ax.set_xlim(xMin, xMax)
-
-            if not rangoY:
-                yMin, yMax = ylimActual
-                ax.set_ylim(yMin, yMax)
-        else:
-            # Rangos manuales
-            if rangoX:
-                ax.set_xlim(rangoX)
-            if rangoY:
-                ax.set_ylim(rangoY)
+        # Las gráficas DEBEN ocupar TODO el espacio sin dejar márgenes:
+        # los rangos manuales se aplican juntos y los ejes sin rango se
+        # ajustan exactamente a los datos
+        limites = {}
+        if rangoX:
+            limites['xlim'] = rangoX
+        if rangoY:
+            limites['ylim'] = rangoY
+        if limites:
+            ax.set(**limites)
+
+        if not rangoX and not rangoY:
+            ax.autoscale(enable=True, axis='both', tight=True)
+        elif not (rangoX and rangoY):
+            ax.autoscale(enable=True, axis='x' if rangoY else 'y', tight=True)
 
         # Dimensión de ticks
         ax.tick_params(labelsize=self.estilo.dimensionTick)
 
     def _graficarFunciones(self, ax, funciones):
-        """Grafica todas las funciones añadidas."""
+        """
+        Grafica todas las funciones añadidas.
+
+        Los elementos se separan por tipo (curvas, rellenos, líneas, puntos)
+        y cada grupo se dibuja de una vez con su propio método. El orden de
+        apilado lo decide el zorder de cada tipo, no el orden de inserción.
+        """
+        grupos = {}
         for datosFuncion in funciones:
-            tipo_func = datosFuncion.get('tipo')
-
-            if tipo_func == 'punto':
-                self._graficarPunto(ax, datosFuncion)
-            elif tipo_func == 'linea_vertical':
-                self._graficarLineaVertical(ax, datosFuncion)
-            elif tipo_func == 'linea_horizontal':
-                self._graficarLineaHorizontal(ax, datosFuncion)
-            elif tipo_func == 'relleno':
-                self._graficarRelleno(ax, datosFuncion)
-            else:
-                self._graficarCurva(ax, datosFuncion)
+            grupos.setdefault(type(datosFuncion), []).append(datosFuncion)
+
+        lineasCurvas = {}
+        for tipo, graficador in self._GRAFICADORES.items():
+            registros = grupos.get(tipo)
+            if registros:
+                lineas = graficador(self, ax, registros)
+                if lineas:
+                    lineasCurvas.update(lineas)
+
+        return lineasCurvas
     
-    def _graficarCurva(self, ax, datosFuncion):
-        """Grafica una curva, ocultando partes negativas."""
-        funcion = datosFuncion['funcion']
-
-        # Determinar rango de x
-        if datosFuncion['rango']:
-            xMin, xMax = datosFuncion['rango']
-        elif self.rangoX:
-            xMin, xMax = self.rangoX
-        else:
-            # AUTODETECCIÓN DE RANGO (v0.3.1)
-            # Si el usuario no especificó rango, intentamos deducirlo de los datos
-            # Para tuplas (x, y), usamos directamente los valores de x
+    def _numeroMuestras(self, ax) -> int:
+        """
+        Número de puntos a evaluar según el ancho del eje en píxeles.
+
+        Un eje pequeño (ej. en una matriz de 4x4) no necesita 500 muestras:
+        con ~1.2 muestras por píxel la curva se ve igual y se evalúa menos.
+        A la inversa, una figura de alta resolución admite más muestras.
+        """
+        try:
+            anchoPx = ax.get_window_extent().width
+            maximo = _MUESTRAS_MAX * max(1.0, ax.figure.dpi / _DPI_REFERENCIA)
+        except Exception:
+            return _MUESTRAS_MAX
+        return int(np.clip(anchoPx * 1.2, _MUESTRAS_MIN, maximo))
+
+    def _mallaX(self, xMin: float, xMax: float, nMuestras: int) -> np.ndarray:
+        """
+        Malla np.linspace(xMin, xMax, nMuestras), compartida por todas las
+        curvas y rellenos con el mismo rango (y entre dibujos sucesivos).
+
+        Se marca como solo lectura para que ninguna evaluación la modifique.
+        """
+        clave = (xMin, xMax, nMuestras)
+        malla = self._cacheMallas.get(clave)
+        if malla is None:
+            # Acotar la caché si se graficaron muchos rangos distintos
+            if len(self._cacheMallas) >= _MAX_MALLAS:
+                self._cacheMallas.clear()
+            malla = np.linspace(xMin, xMax, nMuestras)
+            malla.flags.writeable = False
+            self._cacheMallas[clave] = malla
+        return malla
+
+    def _rangoCurva(self, datosFuncion) -> Tuple[float, float]:
+        """Rango de x de una curva: el propio, el del Lienzo o (0, 100) por defecto."""
+        if datosFuncion.rango:
+            return tuple(datosFuncion.rango)
+        if self.rangoX:
+            return tuple(self.rangoX)
+        return (0, 100)
+
+    def _muestrearCurvas(self, ax, funciones) -> dict:
+        """
+        Evalúa todas las curvas de una lista de elementos.
+
+        Las curvas que comparten rango usan una sola malla de x y se guardan
+        como filas de un mismo arreglo 2D, así el filtro de NaN/infinitos se
+        calcula en una sola pasada por grupo. Cada curva conserva su propia
+        máscara: un NaN en una curva no recorta a las demás.
+
+        Returns:
+            {id(curva): (valoresX, valoresY, finitos)}
+        """
+        muestras = {}
+        grupos = {}
+
+        for datosFuncion in funciones:
+            if not isinstance(datosFuncion, _Curva):
+                continue
+
+            funcion = datosFuncion.funcion
             if isinstance(funcion, tuple) and len(funcion) == 2:
-                valoresXTemp = np.array(funcion[0])
-                xMin = float(np.min(valoresXTemp))
-                xMax = float(np.max(valoresXTemp))
+                # Datos pre-calculados - USAR DIRECTAMENTE sin linspace
+                # (asarray no copia si ya son arreglos de floats)
+                valoresX = np.asarray(funcion[0], dtype=float)
+                valoresY = np.asarray(funcion[1], dtype=float)
+                muestras[id(datosFuncion)] = (valoresX, valoresY, np.isfinite(valoresY))
             else:
-                # Para funciones, usar rango por defecto
-                xMin, xMax = 0, 100
-
-        valoresX = np.linspace(xMin, xMax, 500)
-
-        # Calcular valoresY según el tipo de función
-        if isinstance(funcion, tuple) and len(funcion) == 2:
-            # Datos pre-calculados - USAR DIRECTAMENTE sin linspace
-            valoresX, valoresY = funcion
-            valoresX = np.array(valoresX)
-            valoresY = np.array(valoresY)
-        elif datosFuncion['esOikos']:
+                grupos.setdefault(self._rangoCurva(datosFuncion), []).append(datosFuncion)
+
+        if not grupos:
+            return muestras
+
+        nMuestras = self._numeroMuestras(ax)
+        for (xMin, xMax), curvas in grupos.items():
+            valoresX = self._mallaX(xMin, xMax, nMuestras)
+            matrizY = np.empty((len(curvas), nMuestras))
+            # Divisiones por cero, raíces de negativos, etc. dan NaN/inf sin avisos
+            with np.errstate(all='ignore'):
+                for fila, datosFuncion in enumerate(curvas):
+                    # La misma función en otra cuadrante con el mismo rango no se
+                    # vuelve a evaluar (id() es estable durante un graficar())
+                    clave = (id(datosFuncion.funcion), xMin, xMax, nMuestras)
+                    valoresY = self._cacheEvaluacion.get(clave)
+                    if valoresY is None:
+                        valoresY = self._evaluarCurva(datosFuncion, valoresX)
+                        self._cacheEvaluacion[clave] = valoresY
+                    matrizY[fila] = valoresY
+
+            finitos = np.isfinite(matrizY)
+            for fila, datosFuncion in enumerate(curvas):
+                muestras[id(datosFuncion)] = (valoresX, matrizY[fila], finitos[fila])
+
+        return muestras
+
+    def _evaluarCurva(self, datosFuncion, valoresX):
+        """Calcula valoresY de una curva (objeto de oikos o callable) en valoresX."""
+        funcion = datosFuncion.funcion
+
+        if datosFuncion.esOikos:
             # Objeto de oikos
-            valoresY = self._evaluarObjetoOikos(funcion, valoresX)
-        elif callable(funcion):
-            # Función Python normal
-            valoresY = np.array([funcion(x) for x in valoresX])
-        else:
-            raise TypeError(
-                f"Tipo de función no soportado: {type(funcion).__name__}. "
-                f"Se esperaba un objeto de oikos, función callable o tupla (x, y)."
-            )
+            return self._evaluarObjetoOikos(funcion, valoresX)
 
-        # Asegurar que valoresY sea un array numpy
-        if not isinstance(valoresY, np.ndarray):
-            valoresY = np.array(valoresY)
+        if callable(funcion):
+            # Función Python normal: primero intentamos evaluarla sobre todo el
+            # arreglo. Si ya sabemos que no acepta arreglos (tiene ufunc), no se
+            # vuelve a probar en los siguientes graficar()
+            if datosFuncion.ufunc is None:
+                valoresY = _evaluarEnArreglo(funcion, valoresX)
+                if valoresY is not None:
+                    return valoresY
+                # Solo acepta escalares: numpy recorre el arreglo por nosotros
+                datosFuncion.ufunc = np.frompyfunc(funcion, 1, 1)
+            try:
+                # Si algún valor es complejo se toma la parte real, como en
+                # _evaluarPuntoAPunto
+                return np.real(datosFuncion.ufunc(valoresX).astype(complex))
+            except _ERRORES_EVALUACION:
+                # La función falla en algún x: punto a punto, con NaN donde falle
+                return _evaluarPuntoAPunto(funcion, valoresX)
+
+        raise TypeError(
+            f"Tipo de función no soportado: {type(funcion).__name__}. "
+            f"Se esperaba un objeto de oikos, función callable o tupla (x, y)."
+        )
+
+    def _graficarCurvas(self, ax, curvas) -> dict:
+        """
+        Evalúa todas las curvas juntas (agrupadas por rango) y las grafica.
+
+        Returns:
+            {id(curva): Line2D} de las curvas que se llegaron a dibujar
+        """
+        muestras = self._muestrearCurvas(ax, curvas)
+        lineas = {}
+        for datosFuncion in curvas:
+            linea = self._graficarCurva(ax, datosFuncion, muestras[id(datosFuncion)])
+            if linea is not None:
+                lineas[id(datosFuncion)] = linea
+        return lineas
+
+    def _graficarCurva(self, ax, datosFuncion, muestra):
+        """Grafica una curva ya evaluada por _muestrearCurvas() y devuelve su Line2D."""
+        valoresX, valoresY, finitos = muestra
 
         # GRAFICAR TODA LA FUNCIÓN: incluir valores negativos y positivos
         # Solo filtrar valores NaN/infinitos
-        mask = ~np.isnan(valoresY) & ~np.isinf(valoresY)
-        valoresXFiltrados = valoresX[mask]
-        valoresYFiltrados = valoresY[mask]
+        valoresXFiltrados = valoresX[finitos]
+        valoresYFiltrados = valoresY[finitos]
 
         # Solo graficar si hay puntos válidos
         if len(valoresXFiltrados) > 0:
-            ax.plot(
-                valoresXFiltrados, valoresYFiltrados,
-                color=datosFuncion['color'],
-                linewidth=datosFuncion['anchoLinea'],
-                linestyle=datosFuncion['estiloLinea'],
-                label=datosFuncion['etiqueta'],
-                zorder=3
-            )
+            linea, = ax.plot(valoresXFiltrados, valoresYFiltrados, **datosFuncion.kwargsPlot)
+            return linea
+        return None
+
+    def _graficarRellenos(self, ax, rellenos):
+        """Grafica todas las áreas de relleno."""
+        for datosRelleno in rellenos:
+            self._graficarRelleno(ax, datosRelleno)
 
     def _graficarRelleno(self, ax, datosRelleno):
         """Grafica un área de relleno."""
-        rangoX = datosRelleno['rangoX'] or self.rangoX or (0, 100)
-        valoresX = np.linspace(rangoX[0], rangoX[1], 500)
+        rangoX = datosRelleno.rangoX or self.rangoX or (0, 100)
+        valoresX = self._mallaX(rangoX[0], rangoX[1], self._numeroMuestras(ax))
 
-        # Evaluar funciones
-        y1 = self._evaluarFuncion(datosRelleno['funcion1'], valoresX)
-        y2 = self._evaluarFuncion(datosRelleno['funcion2'], valoresX) if datosRelleno['funcion2'] else 0
+        # Evaluar funciones (NaN/inf sin avisos, se filtran abajo)
+        with np.errstate(all='ignore'):
+            y1 = self._evaluarFuncion(datosRelleno.funcion1, valoresX)
+            y2 = self._evaluarFuncion(datosRelleno.funcion2, valoresX) if datosRelleno.funcion2 else 0
 
         # Filtrar solo valores NaN/infinitos
         if isinstance(y1, np.ndarray):
-            mask = ~np.isnan(y1) & ~np.isinf(y1)
+            mask = np.isfinite(y1)
             if isinstance(y2, np.ndarray):
-                mask = mask & ~np.isnan(y2) & ~np.isinf(y2)
+                np.logical_and(mask, np.isfinite(y2), out=mask)
         else:
             mask = np.ones(len(valoresX), dtype=bool)
 
@@ -1070,63 +1875,146 @@ class Lienzo:
         if len(valoresXFiltrados) > 0:
             ax.fill_between(
                 valoresXFiltrados, y1_filtrado, y2_filtrado,
-                color=datosRelleno['color'],
-                alpha=datosRelleno['alpha'],
-                label=datosRelleno['etiqueta'],
-                zorder=1
+                **datosRelleno.kwargsPlot
             )
 
-    def _graficarPunto(self, ax, datosPunto):
-        """Grafica un punto."""
-        xVal = datosPunto['x']
-        yVal = datosPunto['y']
-
-        # Agregar líneas guía en forma de cruz si está activado
-        if datosPunto.get('mostrarLineasGuia', True):
-            ax.axvline(x=xVal, color='gray', linestyle=':', alpha=0.5, zorder=1)
-            ax.axhline(y=yVal, color='gray', linestyle=':', alpha=0.5, zorder=1)
-
-        ax.plot(
-            xVal, yVal,
-            marker=datosPunto['marcador'],
-            color=datosPunto['color'],
-            markersize=datosPunto['dimension'],
-            label=datosPunto['etiqueta'],
-            zorder=5
+    def _graficarPuntos(self, ax, puntos):
+        """Grafica todos los puntos y, de una vez, sus líneas guía."""
+        for datosPunto in puntos:
+            self._graficarPunto(ax, datosPunto)
+
+        puntosConGuia = [p for p in puntos if p.mostrarLineasGuia]
+        if puntosConGuia:
+            self._graficarLineasGuia(ax, puntosConGuia)
+
+    def _graficarLineasGuia(self, ax, puntos):
+        """
+        Dibuja las líneas guía en forma de cruz de todos los puntos a la vez.
+
+        En lugar de un axvline + axhline por punto, se crean dos LineCollection
+        (verticales y horizontales). Cada segmento va de 0 a 1 en coordenadas
+        del eje, igual que axvline/axhline, así que cruzan todo el gráfico.
+        """
+        from matplotlib.collections import LineCollection
+
+        estiloGuia = dict(colors='gray', linestyles=':', alpha=0.5, zorder=1)
+
+        # x en datos, y en fracción del eje (y al revés para las horizontales)
+        verticales = [((p.x, 0), (p.x, 1)) for p in puntos]
+        horizontales = [((0, p.y), (1, p.y)) for p in puntos]
+
+        ax.add_collection(
+            LineCollection(verticales, transform=ax.get_xaxis_transform(), **estiloGuia),
+            autolim=False
+        )
+        ax.add_collection(
+            LineCollection(horizontales, transform=ax.get_yaxis_transform(), **estiloGuia),
+            autolim=False
         )
 
+    def _graficarPunto(self, ax, datosPunto):
+        """Grafica un punto (sus líneas guía las dibuja _graficarLineasGuia)."""
+        xVal = datosPunto.x
+        yVal = datosPunto.y
+
+        ax.plot(xVal, yVal, **datosPunto.kwargsPlot)
+
         # Agregar nombre si se especifica
-        if datosPunto.get('mostrarNombre') and datosPunto.get('nombre'):
+        if datosPunto.mostrarNombre and datosPunto.nombre:
             ax.annotate(
-                datosPunto['nombre'],
+                datosPunto.nombre,
                 xy=(xVal, yVal),
                 xytext=(5, 5),
                 textcoords='offset points',
                 fontsize=self.estilo.dimensionLabel,
-                color=datosPunto['color']
+                color=datosPunto.color
+            )
+
+    def _graficarLineasVerticales(self, ax, lineas):
+        """
+        Grafica todas las líneas verticales.
+
+        Las que tienen etiqueta usan axvline (necesitan su entrada en la
+        leyenda); las demás se dibujan juntas en una sola LineCollection.
+        """
+        sinEtiqueta = []
+        for datosLinea in lineas:
+            if datosLinea.etiqueta:
+                self._graficarLineaVertical(ax, datosLinea)
+            else:
+                sinEtiqueta.append(datosLinea)
+
+        if sinEtiqueta:
+            self._graficarColeccionReferencia(
+                ax, [((l.x, 0), (l.x, 1)) for l in sinEtiqueta], sinEtiqueta,
+                ax.get_xaxis_transform()
+            )
+            _incluirEnLimites(ax, sinEtiqueta, ())
+
+    def _graficarLineasHorizontales(self, ax, lineas):
+        """Grafica todas las líneas horizontales (igual que las verticales)."""
+        sinEtiqueta = []
+        for datosLinea in lineas:
+            if datosLinea.etiqueta:
+                self._graficarLineaHorizontal(ax, datosLinea)
+            else:
+                sinEtiqueta.append(datosLinea)
+
+        if sinEtiqueta:
+            self._graficarColeccionReferencia(
+                ax, [((0, l.y), (1, l.y)) for l in sinEtiqueta], sinEtiqueta,
+                ax.get_yaxis_transform()
             )
+            _incluirEnLimites(ax, (), sinEtiqueta)
+
+    def _graficarColeccionReferencia(self, ax, segmentos, lineas, transformacion):
+        """
+        Dibuja líneas de referencia sin etiqueta como una sola LineCollection.
+
+        Los segmentos van de 0 a 1 en coordenadas del eje, igual que
+        axvline/axhline, así que cruzan todo el gráfico.
+        """
+        import matplotlib
+        from matplotlib.collections import LineCollection
+
+        # Sin color o estilo se usan los valores por defecto, como en axvline/axhline
+        colorDefecto = matplotlib.rcParams['lines.color']
+        estiloDefecto = matplotlib.rcParams['lines.linestyle']
+
+        ax.add_collection(
+            LineCollection(
+                segmentos,
+                transform=transformacion,
+                colors=[l.color or colorDefecto for l in lineas],
+                linestyles=[l.estiloLinea or estiloDefecto for l in lineas],
+                alpha=0.5,
+                zorder=2
+            ),
+            autolim=False
+        )
 
     def _graficarLineaVertical(self, ax, datosLinea):
         """Grafica una línea vertical."""
-        ax.axvline(
-            x=datosLinea['x'],
-            color=datosLinea['color'],
-            linestyle=datosLinea['estiloLinea'],
-            alpha=0.5,
-            label=datosLinea['etiqueta'],
-            zorder=2
-        )
+        ax.axvline(x=datosLinea.x, **datosLinea.kwargsPlot)
 
     def _graficarLineaHorizontal(self, ax, datosLinea):
         """Grafica una línea horizontal."""
-        ax.axhline(
-            y=datosLinea['y'],
-            color=datosLinea['color'],
-            linestyle=datosLinea['estiloLinea'],
-            alpha=0.5,
-            label=datosLinea['etiqueta'],
-            zorder=2
-        )
+        ax.axhline(y=datosLinea.y, **datosLinea.kwargsPlot)
+
+    # Método que dibuja todos los registros de cada tipo. El orden del dict
+    # es el orden en que se agregan al eje (la leyenda sigue el orden de
+    # inserción, ver _agregarLeyenda)
+    _GRAFICADORES = {
+        _Curva: _graficarCurvas,
+        _Relleno: _graficarRellenos,
+        _LineaVertical: _graficarLineasVerticales,
+        _LineaHorizontal: _graficarLineasHorizontales,
+        _Punto: _graficarPuntos,
+    }
+
+    # Tipos que toman un color de la paleta si no se indicó uno (las líneas de
+    # referencia sin color quedan con el color por defecto de matplotlib)
+    _TIPOS_COLOR_AUTOMATICO = (_Curva, _Punto, _Relleno)
     
     def _evaluarObjetoOikos(self, obj, valoresX):
         """
@@ -1136,30 +2024,28 @@ class Lienzo:
         - Si tenemos Q = 100 - 2P, graficamos P en el eje Y vs Q en el eje X
         - Por lo tanto: valoresX representa cantidades (Q), valoresY representa precios (P)
         - Usamos obj.precio(cantidad) para obtener P dado Q
+
+        Los objetos que saben evaluar su precio sobre un arreglo completo
+        exponen _precioVectorizado(cantidades), que devuelve el arreglo de
+        precios o None si no puede (ej. Demanda y Oferta no polinómicas).
         """
-        import numpy as np
+        precioVectorizado = getattr(obj, '_precioVectorizado', None)
+        if precioVectorizado is not None:
+            valoresY = precioVectorizado(valoresX)
+            if valoresY is not None:
+                return valoresY
+
+        precio, tieneExpresion, llamable = self._metodosOikos(obj)
 
         # ECONOMISTAS GRAFICAN INVERSAS: eje X = cantidad (Q), eje Y = precio (P)
         # Por lo tanto, siempre usamos precio(cantidad)
-        if hasattr(obj, 'precio') and callable(obj.precio):
-            valoresY = []
-            for q in valoresX:  # valoresX son cantidades
-                try:
-                    p = obj.precio(q)  # obtenemos precio
-                    # Asegurar que sea real
-                    if isinstance(p, complex):
-                        p = p.real
-                    valoresY.append(p)
-                except Exception:
-                    valoresY.append(np.nan)
-            return np.array(valoresY)
+        if precio is not None:
+            return _evaluarPuntoAPunto(precio, valoresX)  # valoresX son cantidades
 
         # Si tiene expresión simbólica, convertirla a función
-        if hasattr(obj, 'expresion'):
+        if tieneExpresion:
             try:
-                from sympy import lambdify
-                var = list(obj.expresion.free_symbols)[0]
-                func = lambdify(var, obj.expresion, 'numpy')
+                func = self._lambdificar(obj)
                 valoresY = func(valoresX)
                 # Asegurar que sean reales
                 if np.iscomplexobj(valoresY):
@@ -1169,46 +2055,69 @@ class Lienzo:
                 pass
 
         # Si tiene __call__, intentar usarlo
-        if hasattr(obj, '__call__') and not isinstance(obj, type):
-            try:
-                valoresY = []
-                for x in valoresX:
-                    try:
-                        y = obj(x)
-                        if isinstance(y, complex):
-                            y = y.real
-                        valoresY.append(y)
-                    except Exception:
-                        valoresY.append(np.nan)
-                return np.array(valoresY)
-            except (TypeError, ValueError):
-                pass
+        if llamable is not None:
+            return _evaluarPuntoAPunto(llamable, valoresX)
 
         raise ValueError(
             f"No se pudo evaluar el objeto oikos: {type(obj)}. "
             f"Asegúrate de que tenga un método .cantidad(p), .precio(q) o una expresión evaluable."
         )
     
+    def _metodosOikos(self, obj):
+        """
+        Resuelve una sola vez por objeto cómo evaluarlo.
+
+        Returns:
+            (precio, tieneExpresion, llamable): el método precio (o None), si
+            tiene atributo expresion, y el propio objeto si es invocable (o None)
+        """
+        guardado = self._cacheMetodos.get(id(obj))
+        # Guardamos también el objeto: así un id reutilizado no da un falso acierto
+        if guardado is not None and guardado[0] is obj:
+            return guardado[1]
+
+        precio = getattr(obj, 'precio', None)
+        metodos = (
+            precio if callable(precio) else None,
+            hasattr(obj, 'expresion'),
+            obj if callable(obj) and not isinstance(obj, type) else None,
+        )
+        self._cacheMetodos[id(obj)] = (obj, metodos)
+        return metodos
+
+    def _lambdificar(self, obj):
+        """
+        Convierte obj.expresion en una función de numpy, reutilizando la
+        conversión anterior mientras la expresión no cambie.
+
+        lambdify genera y compila código en cada llamada, así que guardamos
+        (hash de la expresión, función) en el propio objeto.
+        """
+        clave = hash(obj.expresion)
+        guardada = getattr(obj, '_lambdificada', None)
+        if guardada is not None and guardada[0] == clave:
+            return guardada[1]
+
+        var = list(obj.expresion.free_symbols)[0]
+        func = _funcionPolinomica(obj.expresion, var)
+        if func is None:
+            from sympy import lambdify
+            func = lambdify(var, obj.expresion, 'numpy')
+        try:
+            obj._lambdificada = (clave, func)
+        except AttributeError:
+            # Objetos con __slots__ o inmutables: simplemente no se guarda
+            pass
+        return func
+
     def _evaluarFuncion(self, funcion, valoresX):
         """Evalúa cualquier tipo de función."""
-        import numpy as np
-
         if funcion is None:
             return 0
         elif hasattr(funcion, '__module__') and 'oikos' in str(funcion.__module__):
             return self._evaluarObjetoOikos(funcion, valoresX)
         elif callable(funcion):
-            valoresY = []
-            for x in valoresX:
-                try:
-                    y = funcion(x)
-                    # Asegurar que sea real
-                    if isinstance(y, complex):
-                        y = y.real
-                    valoresY.append(y)
-                except Exception:
-                    valoresY.append(np.nan)
-            return np.array(valoresY)
+            return _evaluarPuntoAPunto(funcion, valoresX)
         else:
             return funcion
     
@@ -1218,11 +2127,32 @@ class Lienzo:
             return funcion.__class__.__name__
         return None
     
-    def _obtenerSiguienteColor(self):
-        """Obtiene el siguiente color de la paleta."""
-        color = self.estilo.paletaColores[self._indiceColor % len(self.estilo.paletaColores)]
-        self._indiceColor += 1
-        return color
+    def _asignarColores(self, funciones, indiceColor: int) -> int:
+        """
+        Asigna los colores automáticos pendientes (color=None) de la paleta
+        a las curvas, puntos y rellenos.
+
+        Se recorren en orden de inserción continuando el ciclo desde
+        indiceColor, todos en una sola operación con np.take. El color queda
+        fijo en el elemento para los siguientes dibujos.
+
+        Returns:
+            El nuevo índice del ciclo de colores
+        """
+        sinColor = [
+            d for d in funciones
+            if d.color is None and type(d) in self._TIPOS_COLOR_AUTOMATICO
+        ]
+        if not sinColor:
+            return indiceColor
+
+        indices = np.arange(indiceColor, indiceColor + len(sinColor))
+        colores = np.take(self._cicloColores, indices, mode='wrap')
+        for datos, color in zip(sinColor, colores):
+            datos.color = color
+            datos.kwargsPlot['color'] = color
+
+        return indiceColor + len(sinColor)
 
 
 # ============= FUNCIONES DE UTILIDAD =============
@@ -1285,7 +2215,6 @@ def graficoRapido(*funciones, **kwargs):
     if len(funciones) == 2 and hasattr(funciones[0], '__iter__') and hasattr(funciones[1], '__iter__'):
         # Verificar si el segundo argumento es una lista de arrays
         try:
-            import numpy as np
             xVals = funciones[0]
             yVals = funciones[1]
 
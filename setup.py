@@ -44,7 +44,7 @@ setup(
         "scipy",
         "latex2sympy2",
         "ipython",
-        "matplotlib",
+        "matplotlib>=3.5",
         "rich"
     ],
     
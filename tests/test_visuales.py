@@ -0,0 +1,155 @@
+"""
+Pruebas de oikos.utilidades.visuales (Lienzo y EstiloGrafico).
+"""
+
+import matplotlib
+matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+import pytest
+
+from oikos.utilidades.visuales import Lienzo, EstiloGrafico
+
+
+@pytest.fixture(autouse=True)
+def cerrarFiguras():
+    yield
+    plt.close('all')
+
+
+def test_estiloConDimensionFiguraEnLista():
+    estilo = EstiloGrafico(dimensionFigura=[8, 6])
+    assert estilo.dimensionFigura == (8, 6)
+
+    lienzo = Lienzo(estilo=estilo)
+    lienzo.agregar(lambda x: 100 - x)
+    fig, _ = lienzo.graficar(mostrar=False)
+
+    assert tuple(fig.get_size_inches()) == (8, 6)
+
+
+def test_graficarNoAlteraRcParamsGlobales(tmp_path):
+    antes = dict(matplotlib.rcParams)
+
+    estilo = EstiloGrafico(familiaFuente='serif', simplificarTrazos=False, umbralSimplificacion=0.5)
+    lienzo = Lienzo(estilo=estilo)
+    lienzo.agregar(lambda x: 100 - x)
+    _, ax = lienzo.graficar(mostrar=False)
+    lienzo.guardar(tmp_path / "grafico.png")
+
+    assert dict(matplotlib.rcParams) == antes
+    # El estilo sí se aplicó a los elementos del gráfico
+    assert ax.title.get_fontfamily() == ['serif']
+    assert not ax.lines[0].get_path().should_simplify
+
+
+def test_guardarRedibujaSiCambiaElTitulo(tmp_path):
+    lienzo = Lienzo()
+    lienzo.agregar(lambda x: 100 - x)
+    figGraficada, _ = lienzo.graficar(mostrar=False)
+
+    # Sin cambios se guarda la misma figura
+    fig, _ = lienzo.guardar(tmp_path / "igual.png")
+    assert fig is figGraficada
+
+    lienzo.titulo = "Mercado"
+    fig, ax = lienzo.guardar(tmp_path / "titulo.png")
+    assert fig is not figGraficada
+    assert ax.get_title() == "Mercado"
+
+
+def test_guardarRedibujaSiCambiaLaDemanda(tmp_path):
+    from oikos.microeconomia.mercado import Demanda
+
+    demanda = Demanda("Q = 100 - 2P")
+    lienzo = Lienzo()
+    lienzo.agregar(demanda)
+    figGraficada, _ = lienzo.graficar(mostrar=False)
+
+    demanda.expresion = Demanda("Q = 80 - 2P").expresion
+    fig, _ = lienzo.guardar(tmp_path / "demanda.png")
+    assert fig is not figGraficada
+
+
+def test_leyendaEnOrdenDeInsercion():
+    lienzo = Lienzo(mostrarLeyenda=True)
+    lienzo.agregarPunto(10, 90, etiqueta="Equilibrio")
+    lienzo.agregarLineaVertical(20, etiqueta="Cuota")
+    lienzo.agregar(lambda x: 100 - x, etiqueta="Demanda")
+    lienzo.agregarRelleno(lambda x: 100 - x, rangoX=(0, 10), etiqueta="Excedente")
+    lienzo.agregar(lambda x: x, etiqueta="Oferta")
+    _, ax = lienzo.graficar(mostrar=False)
+
+    etiquetas = [texto.get_text() for texto in ax.get_legend().get_texts()]
+    assert etiquetas == ["Equilibrio", "Cuota", "Demanda", "Excedente", "Oferta"]
+
+
+def test_lineaDeReferenciaSinColorNoConsumePaleta():
+    estilo = EstiloGrafico()
+    lienzo = Lienzo(estilo=estilo)
+    lienzo.agregar(lambda x: 100 - x)
+    lienzo.agregarLineaVertical(20, color=None)
+    lienzo.agregar(lambda x: x)
+    _, ax = lienzo.graficar(mostrar=False)
+
+    demanda, oferta = ax.lines[:2]
+    assert demanda.get_color() == estilo.paletaColores[0]
+    assert oferta.get_color() == estilo.paletaColores[1]
+
+
+def test_funcionEscalarConValoresComplejos():
+    def funcion(x):
+        # Solo acepta escalares; devuelve complejos para x > 50
+        if x <= 50:
+            return float(x)
+        return complex(x, 1)
+
+    lienzo = Lienzo()
+    lienzo.agregar(funcion)
+    _, ax = lienzo.graficar(mostrar=False)
+
+    valoresX, valoresY = ax.lines[0].get_data()
+    assert valoresY.dtype.kind == 'f'
+    assert (valoresY == valoresX).all()
+
+
+def test_funcionEscalarFueraDeDominio():
+    import math
+
+    lienzo = Lienzo()
+    lienzo.agregar(lambda x: math.sqrt(50 - x))
+    _, ax = lienzo.graficar(mostrar=False)
+
+    valoresX, _ = ax.lines[0].get_data()
+    assert valoresX.max() <= 50
+
+
+def test_guardarRedibujaSiCambiaElClosure(tmp_path):
+    intercepto = 100
+
+    def crearDemanda():
+        return lambda x: intercepto - x
+
+    lienzo = Lienzo()
+    lienzo.agregar(crearDemanda())
+    figGraficada, _ = lienzo.graficar(mostrar=False)
+
+    fig, _ = lienzo.guardar(tmp_path / "igual.png")
+    assert fig is figGraficada
+
+    intercepto = 80
+    fig, ax = lienzo.guardar(tmp_path / "closure.png")
+    assert fig is not figGraficada
+    assert ax.lines[0].get_ydata()[0] == 80
+
+
+def test_guardarRedibujaSiLaFuncionUsaValoresNoHashables(tmp_path):
+    parametros = [100, 1]
+
+    lienzo = Lienzo()
+    lienzo.agregar(lambda x, p=parametros: p[0] - p[1] * x)
+    figGraficada, _ = lienzo.graficar(mostrar=False)
+
+    # No se puede saber si la lista cambió: siempre se vuelve a dibujar
+    fig, _ = lienzo.guardar(tmp_path / "lista.png")
+    assert fig is not figGraficada